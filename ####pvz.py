@@ -5,11 +5,28 @@
 # 100% original graphics – no copyrighted assets.
 
 import pygame
+import os
 import sys
+import time
+import types
+import hashlib
+import heapq
 import random
 import math
-import numpy as np
-from dataclasses import dataclass
+import bisect
+import argparse
+import array
+import json
+import importlib
+import itertools
+import functools
+import threading
+import tracemalloc
+import statistics
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 
 # ------------------------------------------------------------------
 # CONSTANTS & GLOBAL SETTINGS
@@ -18,6 +35,11 @@ SCREEN_WIDTH = 1000
 SCREEN_HEIGHT = 700
 FPS = 60
 
+# Fixed-step simulation clock (decoupled from the render rate)
+SIM_HZ = 120
+SIM_DT = 1.0 / SIM_HZ
+MAX_CATCHUP_STEPS = 8  # per rendered frame; older backlog is dropped
+
 # Lawn grid
 ROWS = 5
 COLS = 9
@@ -34,6 +56,7 @@ CARD_BAR_LEFT = LAWN_LEFT
 CARD_W = 120
 CARD_H = 60
 CARD_GAP = 12
+SUN_BOX = (30, 22, 140, 70)
 
 # Gameplay tuning
 START_SUN = 50
@@ -81,25 +104,212 @@ MENU_BUTTON_SHADOW = (60, 40, 20)
 MENU_BUTTON_SELECTED = (255, 220, 150)
 MENU_TITLE = (255, 255, 100)
 
+# ------------------------------------------------------------------
+# LAZY IMPORTS
+# ------------------------------------------------------------------
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access. NumPy is only needed
+    for audio synthesis, the disk cache and the batched simulation paths, so silent and
+    small headless runs never pay its import time or memory.
+    """
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+np = LazyModule("numpy")
+
+def audio_requested(audio=True):
+    """False when audio is switched off by argument or by a non-empty PVZ_NO_AUDIO."""
+    return audio and os.environ.get("PVZ_NO_AUDIO", "") in ("", "0")
+
+# ------------------------------------------------------------------
+# ON-DISK ASSET CACHE
+# ------------------------------------------------------------------
+ASSET_CACHE_VERSION = 1
+
+def default_cache_dir():
+    if os.environ.get("PVZ_CACHE_DIR"): return os.environ["PVZ_CACHE_DIR"]
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "acpvz")
+
+def code_fingerprint(fn):
+    """Hash of a function's bytecode, constants and the simple globals it reads (colors,
+    tuning numbers), so cached output is rebuilt whenever the generator changes."""
+    code = fn.__code__
+    consts = [c for c in code.co_consts if not isinstance(c, types.CodeType)]
+    names = [(n, fn.__globals__.get(n)) for n in code.co_names]
+    names = [(n, v) for n, v in names if isinstance(v, (int, float, str, tuple))]
+    return hashlib.sha1(code.co_code + repr((consts, names)).encode()).hexdigest()[:16]
+
+class AssetDiskCache:
+    """
+    Generated assets persisted as .npy arrays under <directory>/v<ASSET_CACHE_VERSION>/,
+    one file per hash of the generating parameters. Reads are memory-mapped; writes go to a
+    temp file and are renamed into place, so a crash never leaves a half-written entry.
+    Any I/O or format error just means a miss and a rebuild.
+    """
+    def __init__(self, directory=None):
+        self.directory = os.path.join(directory or default_cache_dir(), f"v{ASSET_CACHE_VERSION}")
+        self.hits = 0
+        self.misses = 0
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self.enabled = True
+        except OSError:
+            self.enabled = False
+
+    def path(self, kind, params):
+        digest = hashlib.sha1(repr(params).encode()).hexdigest()[:24]
+        return os.path.join(self.directory, f"{kind}-{digest}.npy")
+
+    def load(self, kind, params):
+        if not self.enabled: return None
+        try:
+            array = np.load(self.path(kind, params), mmap_mode="r")
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return array
+
+    def store(self, kind, params, array):
+        if not self.enabled: return
+        path = self.path(kind, params)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp, path)
+        except OSError:
+            try: os.remove(tmp)
+            except OSError: pass
+
+    def fetch(self, kind, params, build):
+        array = self.load(kind, params)
+        if array is None:
+            array = build()
+            self.store(kind, params, array)
+        return array
+
 # ------------------------------------------------------------------
 # DYNAMIC SOUND ENGINE (Procedural Audio)
 # ------------------------------------------------------------------
+def lowpass_loop(x, alpha=0.2):
+    """Reference one-pole low-pass: y[0] = x[0], y[n] = alpha * x[n] + (1 - alpha) * y[n-1]."""
+    y = np.array(x, dtype=np.float64)
+    for i in range(1, len(y)):
+        y[i] = y[i] * alpha + y[i-1] * (1 - alpha)
+    return y
+
+def lowpass(x, alpha=0.2, block=256):
+    """
+    Vectorized lowpass_loop(). Samples are split into blocks; each block's zero-state
+    response is one matrix product with the filter's truncated impulse response, and the
+    state carried between blocks is chained with a loop over blocks rather than samples.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    n = len(x)
+    if n == 0: return x.copy()
+    decay = 1.0 - alpha
+    n_blocks = -(-n // block)
+    blocks = np.zeros(n_blocks * block)
+    blocks[:n] = x
+    blocks = blocks.reshape(n_blocks, block)
+
+    response, carry_gain = _lowpass_kernel(alpha, block)
+    zero_state = blocks @ response
+
+    # Starting from state x[0] makes y[0] = alpha * x[0] + decay * x[0] = x[0].
+    carry_in = np.empty(n_blocks)
+    state = x[0]
+    ends = zero_state[:, -1].tolist()
+    block_decay = decay ** block
+    for b in range(n_blocks):
+        carry_in[b] = state
+        state = ends[b] + block_decay * state
+    y = zero_state + np.outer(carry_in, carry_gain)
+    return y.reshape(-1)[:n]
+
+@functools.lru_cache(maxsize=8)
+def _lowpass_kernel(alpha, block):
+    """(transposed impulse-response matrix, per-sample gain of the carried-in state)"""
+    decay = 1.0 - alpha
+    k = np.arange(block)
+    lag = k[:, None] - k
+    response = np.where(lag >= 0, alpha * decay ** np.maximum(lag, 0), 0.0)
+    return response.T.copy(), decay ** (k + 1)
+
 class SoundManager:
     """
     Generates sounds procedurally using numpy. 
     Mimics PVZ1's dynamic nature (pitch shifts/variations).
+    Every effect is synthesized once into a bank of cached Sounds (with a fixed set of
+    pitch variants for the randomized ones), so playback never allocates samples.
+    Play requests are queued during a tick and flushed once: duplicates of an effect
+    coalesce into a single louder voice, and per-effect / global voice caps are enforced
+    by stealing the oldest voice.
     """
-    def __init__(self):
+    MAX_VOICES = 12           # global cap (also the mixer channel count)
+    MAX_VOICES_PER_EFFECT = 3
+    # Samples are baked HEADROOM times louder and played at 1 / HEADROOM channel volume,
+    # leaving room to turn a coalesced voice up by COALESCE_BOOST per doubling.
+    HEADROOM = 2.0
+    COALESCE_BOOST = 0.5
+
+    # effect -> (pitch variants in Hz, duration, volume, shape, fade_out)
+    EFFECTS = {
+        "plant":       ((550, 575, 600, 625, 650), 0.1, 0.3, 'sine', True),    # Cheerful 'pop'
+        "sun_collect": ((880, 905, 930, 955, 980), 0.15, 0.2, 'sine', True),   # Sparkle 'ding'
+        "shoot":       ((200,), 0.08, 0.15, 'square', True),                   # 'Plop'
+        "splat":       ((100,), 0.1, 0.2, 'noise', True),                      # Crunchy noise
+        "explosion":   ((60,), 0.4, 0.5, 'noise', True),
+        "lawnmower":   ((150,), 0.2, 0.3, 'square', False),
+    }
+
+    def __init__(self, enabled=True, build=True):
         self.sample_rate = 44100
-        self.enabled = True
+        self.enabled = enabled
+        self.bank = {}
+        # Variant picks use their own RNG so audio never perturbs gameplay randomness.
+        self.rng = random.Random()
+        self.lowpass = lowpass
+        self.disk_cache = None
+        self.pending = {}
+        self.voices = deque()  # (effect, sound, channel), oldest first
+        self.stats = {"requested": 0, "played": 0, "coalesced": 0, "stolen": 0}
+        if not self.enabled:
+            return
         try:
-            pygame.mixer.init(frequency=self.sample_rate, size=-16, channels=2, buffer=512)
+            if not pygame.mixer.get_init():
+                pygame.mixer.init(frequency=self.sample_rate, size=-16, channels=2, buffer=512)
         except:
             self.enabled = False
             print("Audio initialization failed. Running silent.")
+            return
+        pygame.mixer.set_num_channels(self.MAX_VOICES)
+        if build: self.build_bank()
 
-    def _generate_tone(self, frequency, duration, volume=0.5, shape='sine', fade_out=True):
-        if not self.enabled: return None
+    def build_bank(self):
+        for name in self.EFFECTS: self.build_effect(name)
+
+    def build_effect(self, name):
+        """Synthesize one effect's variants. Until it exists, requests for it are dropped."""
+        if not self.enabled or name in self.bank: return
+        freqs, duration, volume, shape, fade_out = self.EFFECTS[name]
+        self.bank[name] = [self._generate_tone(f, duration, volume * self.HEADROOM, shape, fade_out) for f in freqs]
+
+    def _synthesize(self, frequency, duration, volume=0.5, shape='sine', fade_out=True):
+        """Render one effect to a stereo int16 sample array."""
         n_samples = int(duration * self.sample_rate)
         t = np.linspace(0, duration, n_samples, False)
         
@@ -111,15 +321,14 @@ class SoundManager:
         elif shape == 'noise':
             wave = np.random.uniform(-1, 1, n_samples)
             # Low pass filter for 'thump'
-            for i in range(1, n_samples): 
-                wave[i] = wave[i] * 0.2 + wave[i-1] * 0.8
+            wave = self.lowpass(wave, 0.2)
         else:
             wave = np.sin(frequency * t * 2 * np.pi)
 
-        # Envelope (ADSR simplified)
+        # Envelope (ADSR simplified); short effects get a release no longer than themselves
         envelope = np.ones(n_samples)
-        attack = int(0.01 * self.sample_rate)
-        release = int(0.1 * self.sample_rate)
+        attack = min(int(0.01 * self.sample_rate), n_samples)
+        release = min(int(0.1 * self.sample_rate), n_samples)
         envelope[:attack] = np.linspace(0, 1, attack)
         if fade_out:
             envelope[-release:] = np.linspace(1, 0, release)
@@ -130,39 +339,103 @@ class SoundManager:
         stereo = np.column_stack((wave, wave))
         
         # Convert to 16-bit integers
-        sound_array = (stereo * 32767).astype(np.int16)
-        return pygame.sndarray.make_sound(sound_array)
-
-    def play_plant(self):
-        # Cheerful 'pop' sound
-        freq = 600 + random.randint(-50, 50)
-        snd = self._generate_tone(freq, 0.1, volume=0.3, fade_out=True)
-        if snd: snd.play()
+        return (stereo * 32767).astype(np.int16)
 
-    def play_sun_collect(self):
-        # Sparkle 'ding'
-        freq = 880 + random.randint(0, 100)
-        snd = self._generate_tone(freq, 0.15, volume=0.2, fade_out=True)
-        if snd: snd.play()
-
-    def play_shoot(self):
-        # 'Plop' sound
-        freq = 200
-        snd = self._generate_tone(freq, 0.08, volume=0.15, shape='square', fade_out=True)
-        if snd: snd.play()
+    def _generate_tone(self, frequency, duration, volume=0.5, shape='sine', fade_out=True):
+        if not self.enabled: return None
+        args = (frequency, duration, volume, shape, fade_out)
+        if self.disk_cache is None:
+            samples = self._synthesize(*args)
+        else:
+            params = ("tone", self.sample_rate, args, code_fingerprint(SoundManager._synthesize), code_fingerprint(lowpass),
+                      code_fingerprint(_lowpass_kernel.__wrapped__))
+            samples = self.disk_cache.fetch("sound", params, lambda: self._synthesize(*args))
+        return pygame.sndarray.make_sound(np.ascontiguousarray(samples))
+
+    def _play(self, name):
+        if not self.enabled: return
+        self.stats["requested"] += 1
+        self.pending[name] = self.pending.get(name, 0) + 1
+
+    def flush(self):
+        """Start one voice per queued effect. Call once per tick."""
+        if not self.pending: return
+        pending, self.pending = self.pending, {}
+        self._reap_voices()
+        for name, count in pending.items():
+            variants = self.bank.get(name)
+            if not variants: continue
+            self.stats["coalesced"] += count - 1
+            self._steal_for(name)
+            sound = self.rng.choice(variants)
+            channel = sound.play()
+            if channel is None: continue
+            gain = 1.0 + self.COALESCE_BOOST * math.log2(count)
+            channel.set_volume(min(1.0, gain / self.HEADROOM))
+            self.voices.append((name, sound, channel))
+            self.stats["played"] += 1
+
+    def _reap_voices(self):
+        self.voices = deque(v for v in self.voices if v[2].get_busy() and v[2].get_sound() is v[1])
+
+    def _steal_for(self, name):
+        same = [v for v in self.voices if v[0] == name]
+        if len(same) >= self.MAX_VOICES_PER_EFFECT:
+            self._stop(same[0])
+        if len(self.voices) >= self.MAX_VOICES:
+            self._stop(self.voices[0])
+
+    def _stop(self, voice):
+        voice[2].stop()
+        self.voices.remove(voice)
+        self.stats["stolen"] += 1
+
+    @classmethod
+    def benchmark(cls, repeats=5):
+        """Synthesis time per effect with the per-sample loop filter vs the vectorized one.
+        Returns rows of (effect, loop_ms, vectorized_ms)."""
+        sm = cls(enabled=False)
+        rows = []
+        for name, (freqs, duration, volume, shape, fade_out) in cls.EFFECTS.items():
+            timings = []
+            for filt in (lowpass_loop, lowpass):
+                sm.lowpass = filt
+                t0 = time.perf_counter()
+                for _ in range(repeats):
+                    sm._synthesize(freqs[0], duration, volume, shape, fade_out)
+                timings.append((time.perf_counter() - t0) / repeats * 1000.0)
+            rows.append((name, timings[0], timings[1]))
+        return rows
+
+    def play_plant(self): self._play("plant")
+    def play_sun_collect(self): self._play("sun_collect")
+    def play_shoot(self): self._play("shoot")
+    def play_splat(self): self._play("splat")
+    def play_explosion(self): self._play("explosion")
+    def play_lawnmower(self): self._play("lawnmower")
+
+class NullSound:
+    """
+    No-op sound backend for silent runs (headless, --no-audio, PVZ_NO_AUDIO). Same
+    interface as SoundManager, but never touches the mixer, NumPy or the synthesizer.
+    """
+    enabled = False
 
-    def play_splat(self):
-        # Crunchy noise
-        snd = self._generate_tone(100, 0.1, volume=0.2, shape='noise', fade_out=True)
-        if snd: snd.play()
+    def __init__(self):
+        self.bank = {}
+        self.disk_cache = None
+        self.stats = {"requested": 0, "played": 0, "coalesced": 0, "stolen": 0}
 
-    def play_explosion(self):
-        snd = self._generate_tone(60, 0.4, volume=0.5, shape='noise', fade_out=True)
-        if snd: snd.play()
+    def build_bank(self): pass
+    def build_effect(self, name): pass
+    def flush(self): pass
 
-    def play_lawnmower(self):
-        snd = self._generate_tone(150, 0.2, volume=0.3, shape='square', fade_out=False)
-        if snd: snd.play()
+    def play_plant(self): pass
+    def play_sun_collect(self): pass
+    def play_shoot(self): pass
+    def play_splat(self): pass
+    def play_explosion(self): pass
+    def play_lawnmower(self): pass
 
 # ------------------------------------------------------------------
 # HELPER FUNCTIONS
@@ -170,16 +443,88 @@ class SoundManager:
 def clamp(v, lo, hi):
     return max(lo, min(hi, v))
 
+class TextCache:
+    """
+    Bounded LRU of rendered text surfaces keyed by (text, font, color, antialias), plus
+    per-(font, color) digit atlases so changing numbers are composed from pre-rendered
+    glyphs instead of rasterized every frame.
+    """
+    DIGITS = "0123456789"
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.surfaces = OrderedDict()
+        self.atlases = {}
+        self.hits = 0
+        self.misses = 0
+        # Rasterization may also happen on the asset warmup thread.
+        self.lock = threading.Lock()
+
+    def render(self, text, font, color, antialias=True):
+        key = (text, font, color, antialias)
+        with self.lock:
+            surf = self.surfaces.get(key)
+            if surf is not None:
+                self.hits += 1
+                self.surfaces.move_to_end(key)
+                return surf
+            self.misses += 1
+            surf = font.render(text, antialias, color)
+            self.surfaces[key] = surf
+            if len(self.surfaces) > self.maxsize:
+                self.surfaces.popitem(last=False)
+            return surf
+
+    def digits(self, font, color):
+        atlas = self.atlases.get((font, color))
+        if atlas is None:
+            with self.lock:
+                atlas = [font.render(d, True, color) for d in self.DIGITS]
+            self.atlases[(font, color)] = atlas
+        return atlas
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.surfaces), "atlases": len(self.atlases)}
+
+text_cache = TextCache()
+
 def draw_text(surface, text, font, color, x, y, center=True):
-    text_surf = font.render(text, True, color)
+    text_surf = text_cache.render(text, font, color)
     rect = text_surf.get_rect(center=(x, y)) if center else text_surf.get_rect(topleft=(x, y))
     surface.blit(text_surf, rect)
 
+def draw_number(surface, value, font, color, x, y, prefix="", suffix="", center=True):
+    """Like draw_text(prefix + str(value) + suffix) for a non-negative integer value, but the
+    digits are blitted from the atlas instead of rasterized."""
+    atlas = text_cache.digits(font, color)
+    parts = [text_cache.render(prefix, font, color)] if prefix else []
+    parts.extend(atlas[ord(ch) - 48] for ch in str(int(value)))
+    if suffix: parts.append(text_cache.render(suffix, font, color))
+    width = sum(p.get_width() for p in parts)
+    height = max(p.get_height() for p in parts)
+    left = x - width // 2 if center else x
+    top = y - height // 2 if center else y
+    for p in parts:
+        surface.blit(p, (left, top))
+        left += p.get_width()
+
 def grid_to_world(row, col):
     x = LAWN_LEFT + col * TILE_W + TILE_W // 2
     y = LAWN_TOP + row * TILE_H + TILE_H // 2
     return x, y
 
+# Offsets into a tile at which a zombie's 20px bite rect overlaps the 60px plant body; the
+# last offset of the 60 + 20 is a gap.
+BITE_SPAN = 60 + 20 - 1
+
+def bite_col(x):
+    """Column whose plant body (60px wide, centered on the tile) the bite rect of a zombie at
+    x (x - 30 .. x - 10) overlaps, or None. Same answer as the rect test, from arithmetic."""
+    k = int(x - 30) - LAWN_LEFT + 9
+    col = k // TILE_W
+    if 0 <= col < COLS and k - col * TILE_W < BITE_SPAN: return col
+    return None
+
 def world_to_grid(mx, my):
     if mx < LAWN_LEFT or mx >= LAWN_LEFT + COLS * TILE_W:
         return None
@@ -189,10 +534,235 @@ def world_to_grid(mx, my):
     row = (my - LAWN_TOP) // TILE_H
     return int(row), int(col)
 
+# ------------------------------------------------------------------
+# SPRITE ATLAS
+# ------------------------------------------------------------------
+class SpriteAtlas:
+    """
+    Procedural entity art rendered once per (painter, variant) into a transparent surface.
+    Entity classes provide SPRITE_SIZE, SPRITE_ANCHOR (where the entity's x, y lands on the
+    canvas), SPRITE_VARIANTS, a static paint(surf, x, y, variant) and sprite_variant();
+    drawing is then a single blit.
+    """
+    def __init__(self):
+        self.surfaces = {}
+        self.disk_cache = None
+
+    def render(self, cls, variant):
+        if self.disk_cache is None:
+            return self._paint(cls, variant)
+        w, h = cls.SPRITE_SIZE
+        params = ("sprite", cls.__name__, variant, cls.SPRITE_SIZE, cls.SPRITE_ANCHOR, code_fingerprint(cls.paint))
+        pixels = self.disk_cache.fetch("sprite", params, lambda: np.frombuffer(
+            pygame.image.tobytes(self._paint(cls, variant), "RGBA"), np.uint8).reshape(h, w, 4))
+        # Copy off the mapping so cache files are never held open (and can be replaced).
+        return pygame.image.frombuffer(np.ascontiguousarray(pixels).tobytes(), (w, h), "RGBA").copy()
+
+    @staticmethod
+    def _paint(cls, variant):
+        ax, ay = cls.SPRITE_ANCHOR
+        surf = pygame.Surface(cls.SPRITE_SIZE, pygame.SRCALPHA)
+        cls.paint(surf, ax, ay, variant)
+        return surf
+
+    def prepare(self, cls, variant):
+        """Render without converting (safe off the main thread); see convert_all()."""
+        key = (cls.paint, variant)
+        if key not in self.surfaces:
+            self.surfaces[key] = self.render(cls, variant)
+
+    def convert_all(self):
+        if pygame.display.get_surface() is None: return
+        for key, surf in list(self.surfaces.items()):
+            self.surfaces[key] = surf.convert_alpha()
+
+    def get(self, cls, variant):
+        key = (cls.paint, variant)
+        surf = self.surfaces.get(key)
+        if surf is None:
+            surf = self.render(cls, variant)
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert_alpha()
+            self.surfaces[key] = surf
+        return surf
+
+    def blit(self, target, entity):
+        cls = type(entity)
+        ax, ay = cls.SPRITE_ANCHOR
+        target.blit(self.get(cls, entity.sprite_variant()), (int(entity.x) - ax, int(entity.y) - ay))
+
+sprites = SpriteAtlas()
+
+# ------------------------------------------------------------------
+# ENTITY POOLS AND LISTS
+# ------------------------------------------------------------------
+class EntityPool:
+    """
+    Free list of reusable instances of one short-lived entity class (peas, suns). acquire()
+    re-runs __init__ on a released instance when one is available, so steady-state play
+    allocates no new objects and feeds nothing to the garbage collector.
+    """
+    def __init__(self, cls):
+        self.cls = cls
+        self.free = []
+        self.live = 0
+        self.high_water = 0
+        self.created = 0
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            obj = self.free.pop()
+            obj.__init__(*args, **kwargs)
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.created += 1
+        self.live += 1
+        if self.live > self.high_water: self.high_water = self.live
+        return obj
+
+    def release(self, obj):
+        self.live -= 1
+        self.free.append(obj)
+
+    def stats(self):
+        return {"live": self.live, "free": len(self.free), "high_water": self.high_water, "created": self.created}
+
+class EntityList:
+    """
+    Ordered entity container with mark-and-compact removal. An entity is removed by making
+    it fail `live` (dead flag, expired timer); compact() then drops every such entity in one
+    in-place, order-preserving pass and hands each to `on_remove`. Iteration is bounded by
+    the length when it starts, so entities spawned mid-pass wait for the next one, and
+    since removal is deferred nothing shifts under a running loop.
+    """
+    def __init__(self, live, on_remove=None):
+        self.items = []
+        self.live = live
+        self.on_remove = on_remove
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return itertools.islice(self.items, len(self.items))
+
+    def append(self, entity):
+        self.items.append(entity)
+
+    def compact(self):
+        items, live, on_remove = self.items, self.live, self.on_remove
+        j = 0
+        for e in items:
+            if live(e):
+                items[j] = e
+                j += 1
+            elif on_remove is not None:
+                on_remove(e)
+        del items[j:]
+
+    def clear(self):
+        if self.on_remove is not None:
+            for e in self.items: self.on_remove(e)
+        self.items.clear()
+
+def _is_alive(e): return e.alive
+def _sun_live(s): return s.life > 0
+
+# ------------------------------------------------------------------
+# COMPONENT TABLES
+# ------------------------------------------------------------------
+# Only plant behaviours (Shooter, SunProducer) are stored this way. Zombies, peas and suns
+# are still objects in EntityLists; ZombieStore is the opt-in array storage for zombies.
+class ComponentTable:
+    """
+    One component for many entities: parallel array.array columns (one typecode each), plus
+    the owning entity of each row. Removing an entity moves the last row into its hole, so
+    the columns stay dense and systems can walk rows 0 .. n - 1. Stdlib storage keeps the
+    default lawn free of NumPy.
+    """
+    def __init__(self, **typecodes):
+        self.typecodes = typecodes
+        for name, code in typecodes.items(): setattr(self, name, array.array(code))
+        self.n = 0
+        self.owners = []
+        self.rows = {}  # owner -> row
+        self.soonest = math.inf  # lower bound on next_at (removals may leave it early)
+
+    def add(self, owner, **values):
+        for name in self.typecodes: getattr(self, name).append(values[name])
+        if "next_at" in values: self.soonest = min(self.soonest, values["next_at"])
+        self.rows[owner] = self.n
+        self.owners.append(owner)
+        self.n += 1
+
+    def remove(self, owner):
+        i = self.rows.pop(owner, None)
+        if i is None: return
+        last = self.n - 1
+        for name in self.typecodes:
+            column = getattr(self, name)
+            column[i] = column[last]
+            column.pop()
+        moved = self.owners.pop()
+        if i != last:
+            self.owners[i] = moved
+            self.rows[moved] = i
+        self.n = last
+
+    def due(self, now):
+        """
+        Rows whose `next_at` has come due by `now`, for a table with that column. The
+        caller moves each row's next_at forward while iterating; the earliest one is then
+        re-read, so ticks with nothing due cost one comparison.
+        """
+        if now < self.soonest: return
+        next_at = self.next_at
+        yield from [i for i in range(self.n) if next_at[i] <= now]
+        self.soonest = min(next_at) if self.n else math.inf
+
+# ------------------------------------------------------------------
+# EVENT SCHEDULER
+# ------------------------------------------------------------------
+class Scheduler:
+    """
+    Min-heap of (due time, sequence, callback, args) keyed by simulation time. Timers register
+    their next fire time and run_due() pops only what is due, so the per-tick cost scales
+    with the events that fire, not with how many timers exist. While a callback runs, `now` is
+    its exact due time, so repeating timers reschedule without drifting to tick boundaries;
+    ties fire in scheduling order.
+    """
+    def __init__(self):
+        self.heap = []
+        self.seq = itertools.count()
+        self.now = 0.0
+        self.fired = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def at(self, when, callback, *args):
+        heapq.heappush(self.heap, (when, next(self.seq), callback, args))
+
+    def after(self, delay, callback, *args):
+        self.at(self.now + delay, callback, *args)
+
+    def run_due(self, now):
+        heap = self.heap
+        while heap and heap[0][0] <= now:
+            self.now, _, callback, args = heapq.heappop(heap)
+            callback(*args)
+            self.fired += 1
+        self.now = now
+
 # ------------------------------------------------------------------
 # GAME ENTITIES
 # ------------------------------------------------------------------
-@dataclass
+# Every entity owns one bounding box Rect for its whole life (pooled ones keep it across
+# reuse). rect() moves it to the current position in place and returns it, so collision
+# tests and draw bounds allocate no Rect of their own (pygame still returns one from every
+# blit and draw call); callers must not keep it across moves or modify it.
+
+@dataclass(slots=True)
 class Sun:
     x: float
     y: float
@@ -201,9 +771,16 @@ class Sun:
     target_y: float = 0.0
     life: float = 10.0
     floating: bool = False
+    box: pygame.Rect = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not hasattr(self, "box"): self.box = pygame.Rect(0, 0, 36, 36)
 
     def rect(self):
-        return pygame.Rect(int(self.x - 18), int(self.y - 18), 36, 36)
+        box = self.box
+        box.x = int(self.x - 18)
+        box.y = int(self.y - 18)
+        return box
 
     def update(self, dt):
         self.life -= dt
@@ -217,13 +794,27 @@ class Sun:
         else:
             self.y += self.vy * dt
 
+    SPRITE_SIZE = (40, 40)
+    SPRITE_ANCHOR = (20, 20)
+    SPRITE_VARIANTS = (None,)
+
+    def sprite_variant(self): return None
+
+    @staticmethod
+    def paint(surf, x, y, variant):
+        pygame.draw.circle(surf, C_SUN, (x, y), 18)
+        pygame.draw.circle(surf, (255, 245, 160), (x, y), 18, 3)
+
     def draw(self, surf):
-        pygame.draw.circle(surf, C_SUN, (int(self.x), int(self.y)), 18)
-        pygame.draw.circle(surf, (255, 245, 160), (int(self.x), int(self.y)), 18, 3)
+        sprites.blit(surf, self)
 
 
 class Projectile:
-    def __init__(self, row, x, y, speed=360, damage=20, is_frozen=False):
+    __slots__ = ("row", "x", "y", "speed", "damage", "is_frozen", "alive", "plan", "box")
+    SPEED = 360
+    DAMAGE = 20
+
+    def __init__(self, row, x, y, speed=SPEED, damage=DAMAGE, is_frozen=False):
         self.row = row
         self.x = x
         self.y = y
@@ -231,34 +822,68 @@ class Projectile:
         self.damage = damage
         self.is_frozen = is_frozen
         self.alive = True
+        self.plan = 0  # token of the pending predicted hit (Game.predict_hits)
+        if not hasattr(self, "box"): self.box = pygame.Rect(0, 0, 20, 12)
 
     def rect(self):
-        return pygame.Rect(int(self.x - 10), int(self.y - 6), 20, 12)
+        box = self.box
+        box.x = int(self.x - 10)
+        box.y = int(self.y - 6)
+        return box
 
-    def update(self, dt, game):
+    def advance(self, dt):
         self.x += self.speed * dt
         if self.x > SCREEN_WIDTH + 30:
             self.alive = False
-            return
+        return self.alive
 
-        for z in game.zombies:
-            if z.row != self.row or not z.alive:
-                continue
-            if self.rect().colliderect(z.rect()):
-                z.take_damage(self.damage)
-                if self.is_frozen:
-                    z.apply_slow()
-                game.sound.play_splat()
-                self.alive = False
-                break
+    def update(self, dt, game):
+        if not self.advance(dt):
+            return
+        z = game.zombie_index.first_hit(self.row, self.rect())
+        if z is not None:
+            self.hit(z, game)
+
+    def hit(self, z, game):
+        z.take_damage(self.damage)
+        if self.is_frozen:
+            z.apply_slow()
+        if self.is_frozen or not z.alive:
+            game.row_changed(self.row)
+        game.sound.play_splat()
+        self.alive = False
+
+    SPRITE_SIZE = (24, 16)
+    SPRITE_ANCHOR = (12, 8)
+    SPRITE_VARIANTS = (False, True)
+
+    def sprite_variant(self): return self.is_frozen
+
+    @staticmethod
+    def paint(surf, x, y, frozen):
+        r = pygame.Rect(x - 10, y - 6, 20, 12)
+        pygame.draw.ellipse(surf, C_ICE if frozen else C_PEA, r)
+        pygame.draw.ellipse(surf, (30, 60, 30), r, 2)
 
     def draw(self, surf):
-        color = C_ICE if self.is_frozen else C_PEA
-        pygame.draw.ellipse(surf, color, self.rect())
-        pygame.draw.ellipse(surf, (30, 60, 30), self.rect(), 2)
+        sprites.blit(surf, self)
+
 
+# Component specs a plant type declares to opt into a behaviour. Game keeps one
+# ComponentTable per component and one system runs each table.
+@dataclass(frozen=True)
+class Shooter:
+    reload: float = 1.4
+    first: tuple = (0.1, 0.8)  # range of the delay to the first shot
+    frozen: bool = False
+
+@dataclass(frozen=True)
+class SunProducer:
+    reload: float = 7.5
+    first: tuple = (2.5, 5.0)  # range of the delay to the first sun
 
 class Plant:
+    __slots__ = ("row", "col", "x", "y", "hp", "alive", "box")
     name = "Plant"
     cost = 0
     max_hp = 100
@@ -269,13 +894,41 @@ class Plant:
         self.x, self.y = grid_to_world(row, col)
         self.hp = self.max_hp
         self.alive = True
+        self.box = pygame.Rect(0, 0, 60, 70)
 
     def rect(self):
-        return pygame.Rect(int(self.x - 30), int(self.y - 35), 60, 70)
+        box = self.box
+        box.x = int(self.x - 30)
+        box.y = int(self.y - 35)
+        return box
+
+    # Components this type has (None = without); only plants with TICKS get update() every tick.
+    SHOOTER = None
+    SUN_PRODUCER = None
+    TICKS = False
 
     def update(self, dt, game):
         pass
 
+    def visual_key(self):
+        """Anything besides position that changes how the plant looks (for dirty-rect tracking)."""
+        return self.hp
+
+    # Sprite canvas: the 60x70 body plus room for the shooter barrel and Cherry Bomb stem.
+    SPRITE_SIZE = (80, 100)
+    SPRITE_ANCHOR = (40, 60)
+    SPRITE_VARIANTS = (None,)
+
+    def sprite_variant(self): return None
+
+    @staticmethod
+    def paint(surf, x, y, variant):
+        pass
+
+    def draw(self, surf):
+        sprites.blit(surf, self)
+        self.draw_hp_bar(surf)
+
     def draw_hp_bar(self, surf):
         w = 56
         h = 6
@@ -291,105 +944,89 @@ class Plant:
             self.alive = False
 
 class Peashooter(Plant):
+    __slots__ = ()
     name = "Peashooter"
     cost = 100
     max_hp = 180
+    SHOOTER = Shooter()
 
-    def __init__(self, row, col):
-        super().__init__(row, col)
-        self.shoot_cd = 1.4
-        self.timer = random.uniform(0.1, 0.8)
-
-    def update(self, dt, game):
-        self.timer -= dt
-        if self.timer <= 0:
-            has_target = any(z.alive and z.row == self.row and z.x > self.x for z in game.zombies)
-            if has_target:
-                game.projectiles.append(Projectile(self.row, self.x + 25, self.y - 10))
-                game.sound.play_shoot()
-            self.timer = self.shoot_cd
-
-    def draw(self, surf):
-        r = self.rect()
+    @staticmethod
+    def paint(surf, x, y, variant):
+        r = pygame.Rect(x - 30, y - 35, 60, 70)
         pygame.draw.rect(surf, C_P_SHOOTER, r, border_radius=10)
         pygame.draw.rect(surf, (20, 60, 20), r, 2, border_radius=10)
-        pygame.draw.circle(surf, (40, 120, 40), (int(self.x + 22), int(self.y - 10)), 10)
-        self.draw_hp_bar(surf)
+        pygame.draw.circle(surf, (40, 120, 40), (x + 22, y - 10), 10)
 
-class SnowPea(Peashooter):
+class SnowPea(Plant):
+    __slots__ = ()
     name = "Snow Pea"
     cost = 175
-    
-    def update(self, dt, game):
-        self.timer -= dt
-        if self.timer <= 0:
-            has_target = any(z.alive and z.row == self.row and z.x > self.x for z in game.zombies)
-            if has_target:
-                # Frozen projectile
-                game.projectiles.append(Projectile(self.row, self.x + 25, self.y - 10, is_frozen=True))
-                game.sound.play_shoot()
-            self.timer = self.shoot_cd
+    max_hp = 180
+    SHOOTER = Shooter(frozen=True)
 
-    def draw(self, surf):
-        r = self.rect()
+    @staticmethod
+    def paint(surf, x, y, variant):
+        r = pygame.Rect(x - 30, y - 35, 60, 70)
         pygame.draw.rect(surf, C_P_SNOWPEA, r, border_radius=10)
         pygame.draw.rect(surf, (20, 40, 80), r, 2, border_radius=10)
-        pygame.draw.circle(surf, (60, 140, 180), (int(self.x + 22), int(self.y - 10)), 10)
-        self.draw_hp_bar(surf)
+        pygame.draw.circle(surf, (60, 140, 180), (x + 22, y - 10), 10)
 
 class SunflowerPlant(Plant):
+    __slots__ = ()
     name = "Sunflower"
     cost = 50
     max_hp = 160
+    SUN_PRODUCER = SunProducer()
 
-    def __init__(self, row, col):
-        super().__init__(row, col)
-        self.sun_cd = 7.5
-        self.timer = random.uniform(2.5, 5.0)
-
-    def update(self, dt, game):
-        self.timer -= dt
-        if self.timer <= 0:
-            sx = self.x + random.uniform(-10, 10)
-            sy = self.y - 10
-            game.suns.append(Sun(sx, sy, value=SUN_VALUE, vy=-80, target_y=sy, life=9.0, floating=True))
-            self.timer = self.sun_cd
-
-    def draw(self, surf):
-        r = self.rect()
+    @staticmethod
+    def paint(surf, x, y, variant):
+        r = pygame.Rect(x - 30, y - 35, 60, 70)
         pygame.draw.rect(surf, C_P_SUNFLOWER, r, border_radius=10)
         pygame.draw.rect(surf, (120, 90, 20), r, 2, border_radius=10)
-        pygame.draw.circle(surf, (255, 245, 160), (int(self.x), int(self.y - 10)), 16)
-        pygame.draw.circle(surf, (60, 40, 10), (int(self.x - 5), int(self.y - 12)), 3)
-        pygame.draw.circle(surf, (60, 40, 10), (int(self.x + 5), int(self.y - 12)), 3)
-        self.draw_hp_bar(surf)
+        pygame.draw.circle(surf, (255, 245, 160), (x, y - 10), 16)
+        pygame.draw.circle(surf, (60, 40, 10), (x - 5, y - 12), 3)
+        pygame.draw.circle(surf, (60, 40, 10), (x + 5, y - 12), 3)
 
 class Wallnut(Plant):
+    __slots__ = ()
     name = "Wall-nut"
     cost = 50
     max_hp = 720
 
-    def draw(self, surf):
-        r = self.rect()
+    SPRITE_VARIANTS = (0, 1, 2)
+
+    def sprite_variant(self):
+        # Crack stage: 0 intact, 1 below 66% HP, 2 below 33% HP
+        hp_ratio = self.hp / self.max_hp
+        return (hp_ratio < 0.66) + (hp_ratio < 0.33)
+
+    @staticmethod
+    def paint(surf, x, y, cracks):
+        r = pygame.Rect(x - 30, y - 35, 60, 70)
         pygame.draw.rect(surf, C_P_WALLNUT, r, border_radius=14)
         pygame.draw.rect(surf, (90, 60, 30), r, 2, border_radius=14)
-        hp_ratio = self.hp / self.max_hp
-        if hp_ratio < 0.66:
+        if cracks >= 1:
             pygame.draw.line(surf, (80, 50, 25), (r.left + 12, r.top + 14), (r.right - 10, r.bottom - 12), 3)
-        if hp_ratio < 0.33:
+        if cracks >= 2:
             pygame.draw.line(surf, (80, 50, 25), (r.left + 14, r.bottom - 16), (r.right - 14, r.top + 16), 3)
-        self.draw_hp_bar(surf)
 
 class CherryBomb(Plant):
+    __slots__ = ("timer", "exploded")
     name = "Cherry Bomb"
     cost = 150
     max_hp = 100
 
+    FUSE = 1.0
+    REACH = TILE_W * 1.5
+
     def __init__(self, row, col):
         super().__init__(row, col)
-        self.timer = 1.0 # 1 second to explode
+        self.timer = self.FUSE # 1 second to explode
         self.exploded = False
 
+    # The fuse drives the flashing sprite, so it counts down every tick (for one second).
+    TICKS = True
+
     def update(self, dt, game):
         if not self.exploded:
             self.timer -= dt
@@ -397,50 +1034,76 @@ class CherryBomb(Plant):
                 self.exploded = True
                 game.sound.play_explosion()
                 # Kill zombies in 3x3 area
-                for z in game.zombies:
-                    if abs(z.row - self.row) <= 1:
-                        dist = abs(z.x - self.x)
-                        if dist < TILE_W * 1.5:
+                reach = self.REACH
+                for row in range(max(0, self.row - 1), min(ROWS, self.row + 2)):
+                    for z in game.zombie_index.between(row, self.x - reach, self.x + reach):
+                        if abs(z.x - self.x) < reach:
                             z.take_damage(1800) # Instant kill
+                    game.row_changed(row)
                 self.alive = False
+                game.remove_plant(self.row, self.col)
 
-    def draw(self, surf):
-        r = self.rect()
+    def visual_key(self):
+        return self.sprite_variant()
+
+    SPRITE_VARIANTS = (False, True)
+
+    def sprite_variant(self):
         # Flashing effect before explosion
-        if self.timer < 0.5 and int(self.timer * 10) % 2 == 0:
-            color = (255, 255, 255)
-        else:
-            color = C_P_CHERRY
-        
+        return self.timer < 0.5 and int(self.timer * 10) % 2 == 0
+
+    @staticmethod
+    def paint(surf, x, y, flash):
+        r = pygame.Rect(x - 30, y - 35, 60, 70)
+        color = (255, 255, 255) if flash else C_P_CHERRY
+
         pygame.draw.ellipse(surf, color, r.inflate(-10, -10))
         pygame.draw.ellipse(surf, (50, 0, 0), r.inflate(-10, -10), 2)
         # Faces
-        pygame.draw.circle(surf, (255, 255, 255), (int(self.x - 12), int(self.y - 10)), 5)
-        pygame.draw.circle(surf, (255, 255, 255), (int(self.x + 12), int(self.y - 10)), 5)
-        pygame.draw.circle(surf, (0,0,0), (int(self.x - 12), int(self.y - 10)), 2)
-        pygame.draw.circle(surf, (0,0,0), (int(self.x + 12), int(self.y - 10)), 2)
-        
+        pygame.draw.circle(surf, (255, 255, 255), (x - 12, y - 10), 5)
+        pygame.draw.circle(surf, (255, 255, 255), (x + 12, y - 10), 5)
+        pygame.draw.circle(surf, (0,0,0), (x - 12, y - 10), 2)
+        pygame.draw.circle(surf, (0,0,0), (x + 12, y - 10), 2)
+
         # Stem
-        pygame.draw.line(surf, (50, 100, 50), (self.x, self.y - 35), (self.x + 5, self.y - 50), 3)
+        pygame.draw.line(surf, (50, 100, 50), (x, y - 35), (x + 5, y - 50), 3)
+
+    def draw(self, surf):
+        sprites.blit(surf, self)
 
 
 class Zombie:
+    __slots__ = ("row", "x", "y", "base_speed", "speed", "max_hp", "hp", "damage", "alive",
+                 "eating", "target", "slow_timer", "bite_col", "bite_version", "box")
+    MAX_HP = 200
+    DAMAGE = 40          # bite damage per second
+    SPEED = (18, 28)     # range of the walking speed
+    SLOW_TIME = 3.0
+    SLOW_FACTOR = 0.4
+
     def __init__(self, row, x):
         self.row = row
         self.x = x
         self.y = grid_to_world(row, 0)[1]
-        self.base_speed = random.uniform(18, 28)
+        self.base_speed = random.uniform(*self.SPEED)
         self.speed = self.base_speed
-        self.max_hp = 200
+        self.max_hp = self.MAX_HP
         self.hp = self.max_hp
-        self.damage = 40
+        self.damage = self.DAMAGE
         self.alive = True
         self.eating = False
         self.target = None
         self.slow_timer = 0.0
+        # Tile under the mouth and the row's plant version when it was last checked.
+        self.bite_col = None
+        self.bite_version = -1
+        self.box = pygame.Rect(0, 0, 48, 80)
 
     def rect(self):
-        return pygame.Rect(int(self.x - 24), int(self.y - 40), 48, 80)
+        box = self.box
+        box.x = int(self.x - 24)
+        box.y = int(self.y - 40)
+        return box
 
     def take_damage(self, dmg):
         self.hp -= dmg
@@ -448,8 +1111,16 @@ class Zombie:
             self.alive = False
 
     def apply_slow(self):
-        self.slow_timer = 3.0
-        self.speed = self.base_speed * 0.4
+        self.slow_timer = self.SLOW_TIME
+        self.speed = self.base_speed * self.SLOW_FACTOR
+
+    def walk_speed(self):
+        """Current leftward speed: zero while chewing on a live plant."""
+        if self.eating and self.target is not None and self.target.alive: return 0.0
+        return self.speed
+
+    def visual_key(self):
+        return (self.hp, self.slow_timer > 0)
 
     def update(self, dt, game):
         if not self.alive:
@@ -460,17 +1131,27 @@ class Zombie:
             self.slow_timer -= dt
             if self.slow_timer <= 0:
                 self.speed = self.base_speed
+                game.row_changed(self.row)
+
+        if self._eat(dt, game):
+            return
+
+        self.x -= self.speed * dt
+        self._after_move(game)
 
+    def _eat(self, dt, game):
+        """Chew on the current target. Returns True if the zombie spent this tick eating."""
         if self.eating and self.target is not None and self.target.alive:
             self.target.take_damage(self.damage * dt)
             if not self.target.alive:
                 game.remove_plant(self.target.row, self.target.col)
                 self.eating = False
                 self.target = None
-            return
-
-        self.x -= self.speed * dt
+                game.row_changed(self.row)
+            return True
+        return False
 
+    def _after_move(self, game):
         if self.x < LAWN_LEFT - 15:
             if not game.lawnmowers[self.row].used:
                 game.trigger_lawnmower(self.row)
@@ -478,25 +1159,41 @@ class Zombie:
         if self.x < 90:
             game.lose_game()
 
-        bite_rect = pygame.Rect(int(self.x - 30), int(self.y - 30), 20, 60)
-        plant = game.get_plant_colliding(self.row, bite_rect)
-        if plant is not None:
+        # Only look again after crossing into another tile or a plant change in this row.
+        col = bite_col(self.x)
+        version = game.row_versions[self.row]
+        if col == self.bite_col and version == self.bite_version: return
+        self.bite_col = col
+        self.bite_version = version
+        plant = None if col is None else game.grid[self.row][col]
+        if plant is not None and plant.alive:
             self.eating = True
             self.target = plant
+            game.row_changed(self.row)
+
+    SPRITE_SIZE = (60, 100)
+    SPRITE_ANCHOR = (30, 50)
+    SPRITE_VARIANTS = (False, True)
+
+    def sprite_variant(self): return self.slow_timer > 0
+
+    @staticmethod
+    def paint(surf, x, y, frozen):
+        r = pygame.Rect(x - 24, y - 40, 48, 80)
+        base_color = C_ZOMBIE_FROZEN if frozen else C_ZOMBIE
+        dark_color = (100, 130, 170) if frozen else C_ZOMBIE_DARK
 
-    def draw(self, surf):
-        r = self.rect()
-        base_color = C_ZOMBIE_FROZEN if self.slow_timer > 0 else C_ZOMBIE
-        dark_color = C_ZOMBIE_DARK if self.slow_timer <= 0 else (100, 130, 170)
-        
         pygame.draw.rect(surf, base_color, r, border_radius=10)
         pygame.draw.rect(surf, dark_color, r, 2, border_radius=10)
-        pygame.draw.circle(surf, (170, 200, 200) if self.slow_timer <=0 else (200, 220, 255), (int(self.x), int(self.y - 30)), 16)
-        
+        pygame.draw.circle(surf, (200, 220, 255) if frozen else (170, 200, 200), (x, y - 30), 16)
+
         # Eyes
-        pygame.draw.circle(surf, (30, 40, 40), (int(self.x - 5), int(self.y - 32)), 3)
-        pygame.draw.circle(surf, (30, 40, 40), (int(self.x + 5), int(self.y - 32)), 3)
-        
+        pygame.draw.circle(surf, (30, 40, 40), (x - 5, y - 32), 3)
+        pygame.draw.circle(surf, (30, 40, 40), (x + 5, y - 32), 3)
+
+    def draw(self, surf):
+        sprites.blit(surf, self)
+
         # HP Bar
         w = 46; h = 5; x = int(self.x - w / 2); y = int(self.y - 50)
         pygame.draw.rect(surf, (40, 40, 40), (x, y, w, h))
@@ -505,16 +1202,23 @@ class Zombie:
 
 
 class LawnMower:
+    __slots__ = ("row", "x", "y", "speed", "active", "used", "box")
+    SPEED = 560
+
     def __init__(self, row):
         self.row = row
         self.x = LAWN_LEFT - 70
         self.y = grid_to_world(row, 0)[1] + 15
-        self.speed = 560
+        self.speed = self.SPEED
         self.active = False
         self.used = False
+        self.box = pygame.Rect(0, 0, 56, 36)
 
     def rect(self):
-        return pygame.Rect(int(self.x - 28), int(self.y - 18), 56, 36)
+        box = self.box
+        box.x = int(self.x - 28)
+        box.y = int(self.y - 18)
+        return box
 
     def trigger(self):
         if not self.used:
@@ -526,28 +1230,43 @@ class LawnMower:
             return
         self.x += self.speed * dt
         mr = self.rect()
-        for z in game.zombies:
-            if z.alive and z.row == self.row and mr.colliderect(z.rect()):
+        for z in game.zombie_index.between(self.row, mr.left - ZombieIndex.REACH, mr.right + ZombieIndex.REACH):
+            if mr.colliderect(z.rect()):
                 z.alive = False
+                game.row_changed(self.row)
                 game.sound.play_lawnmower()
         if self.x > SCREEN_WIDTH + 80:
             self.active = False
 
-    def draw(self, surf):
-        r = self.rect()
-        base = (200, 60, 60) if self.used else (220, 80, 80)
+    SPRITE_SIZE = (64, 56)
+    SPRITE_ANCHOR = (32, 24)
+    SPRITE_VARIANTS = (False, True)
+
+    def sprite_variant(self): return self.used
+
+    @staticmethod
+    def paint(surf, x, y, used):
+        r = pygame.Rect(x - 28, y - 18, 56, 36)
+        base = (200, 60, 60) if used else (220, 80, 80)
         pygame.draw.rect(surf, base, r, border_radius=8)
         pygame.draw.rect(surf, (60, 20, 20), r, 2, border_radius=8)
         pygame.draw.circle(surf, (50, 50, 50), (r.left + 10, r.bottom), 8)
         pygame.draw.circle(surf, (50, 50, 50), (r.right - 10, r.bottom), 8)
 
+    def draw(self, surf):
+        sprites.blit(surf, self)
+
 
 class SeedCard:
-    def __init__(self, plant_cls, index, recharge=5.0):
+    """Recharge is a deadline on the simulation clock, so cards cost nothing per tick."""
+    __slots__ = ("plant_cls", "index", "recharge", "clock", "ready_at", "rect")
+
+    def __init__(self, plant_cls, index, clock, recharge=5.0):
         self.plant_cls = plant_cls
         self.index = index
         self.recharge = recharge
-        self.cooldown = 0.0
+        self.clock = clock
+        self.ready_at = 0.0
         self.rect = pygame.Rect(
             CARD_BAR_LEFT + index * (CARD_W + CARD_GAP),
             CARD_BAR_TOP,
@@ -561,12 +1280,12 @@ class SeedCard:
     @property
     def cost(self): return self.plant_cls.cost
 
-    def available(self, sun_amount): return self.cooldown <= 0 and sun_amount >= self.cost
+    @property
+    def cooldown(self): return max(0.0, self.ready_at - self.clock.now)
 
-    def update(self, dt):
-        if self.cooldown > 0: self.cooldown -= dt
+    def available(self, sun_amount): return self.cooldown <= 0 and sun_amount >= self.cost
 
-    def start_cooldown(self): self.cooldown = self.recharge
+    def start_cooldown(self): self.ready_at = self.clock.now + self.recharge
 
     def draw(self, surf, font, selected=False, can_afford=True):
         bg = C_CARD_DISABLED if self.cooldown > 0 else C_CARD
@@ -585,6 +1304,312 @@ class SeedCard:
             surf.blit(overlay, (self.rect.x, self.rect.bottom - h))
 
 
+# ------------------------------------------------------------------
+# SPATIAL INDEX
+# ------------------------------------------------------------------
+class ZombieIndex:
+    """
+    Zombies bucketed per row and kept sorted by x, with a parallel list of x keys for bisect.
+    Zombies only ever walk left at similar speeds, so the once-per-tick resort() is a
+    near-linear pass over already ordered data. Dead zombies are skipped by every query
+    and dropped on the next resort().
+    """
+    REACH = 26  # zombie body half-width (24) plus int() rounding slack
+
+    def __init__(self):
+        self.rows = [[] for _ in range(ROWS)]
+        self.keys = [[] for _ in range(ROWS)]
+
+    def add(self, z):
+        keys = self.keys[z.row]
+        i = bisect.bisect_right(keys, z.x)
+        keys.insert(i, z.x)
+        self.rows[z.row].insert(i, z)
+
+    def resort(self):
+        for r in range(ROWS):
+            zs = [z for z in self.rows[r] if z.alive]
+            zs.sort(key=_zombie_x)
+            self.rows[r] = zs
+            self.keys[r] = [z.x for z in zs]
+
+    def between(self, row, x0, x1):
+        """Live zombies in `row` with x0 <= x <= x1, left to right."""
+        keys = self.keys[row]
+        zs = self.rows[row]
+        for i in range(bisect.bisect_left(keys, x0), bisect.bisect_right(keys, x1)):
+            if zs[i].alive: yield zs[i]
+
+    def first_hit(self, row, rect):
+        """Leftmost live zombie in `row` whose body overlaps `rect`, or None."""
+        for z in self.between(row, rect.left - self.REACH, rect.right + self.REACH):
+            if rect.colliderect(z.rect()): return z
+        return None
+
+    def load(self, rows, keys):
+        """Replace the buckets with already sorted per-row lists (see ZombieStore.sorted_rows)."""
+        self.rows = rows
+        self.keys = keys
+
+    def has_target(self, row, x):
+        """True if the rightmost live zombie in `row` is ahead of x."""
+        zs = self.rows[row]
+        for i in range(len(zs) - 1, -1, -1):
+            if zs[i].alive: return zs[i].x > x
+        return False
+
+def _zombie_x(z): return z.x
+
+# Below this many live peas the per-pea index queries beat the NumPy batch setup cost
+# (crossover is ~30 peas), so small lawns never import NumPy for collisions.
+BATCH_COLLISION_MIN = 24
+
+# Pea (20px) and zombie (48px) rects overlap while their centers are closer than this.
+HIT_SPAN = 34
+
+# Combined (row, x) sort key stride: far wider than any x a zombie can reach.
+KEY_STRIDE = 1 << 16
+
+def first_overlaps(p_rows, p_lefts, z_keys):
+    """
+    Vectorized projectile-vs-zombie broad phase. Projectiles are (row, rect left) arrays
+    of 20px-wide peas; z_keys is the sorted array of row * KEY_STRIDE + rect left for
+    48px-wide zombies. Returns, per projectile, the index of the leftmost zombie whose
+    rect overlaps it in x and the exclusive upper key bound for that projectile; the
+    index equals len(z_keys) or points at a key >= the bound when there is no overlap.
+    """
+    base = p_rows * KEY_STRIDE + p_lefts
+    first = np.searchsorted(z_keys, base - 48, side="right")
+    return first, base + 20
+
+# ------------------------------------------------------------------
+# STRUCTURE-OF-ARRAYS ZOMBIE STORE (endless / horde runs)
+# ------------------------------------------------------------------
+class ZombieStore:
+    """
+    Keeps every zombie's hot fields in contiguous NumPy arrays indexed by slot.
+    step() applies death masking, slow decay and walking to all zombies in one batch;
+    StoredZombie views read and write through to the arrays so the rest of the game
+    keeps using plain attribute access. Slot 0 is a permanently dead tombstone that
+    released views are pointed at.
+    """
+    FIELDS = (
+        ("row", "int16"), ("x", "float64"), ("y", "float64"),
+        ("base_speed", "float64"), ("speed", "float64"),
+        ("max_hp", "float64"), ("hp", "float64"), ("damage", "float64"),
+        ("slow_timer", "float64"), ("alive", "bool"), ("eating", "bool"),
+    )
+
+    def __init__(self, capacity=64):
+        self.capacity = 0
+        for name, dtype in self.FIELDS:
+            setattr(self, name, np.zeros(0, dtype))
+        self.used = np.zeros(0, np.bool_)
+        self.views = []
+        self.free = []
+        self.recovered_rows = []  # rows where a slow wore off in the last step()
+        self._grow(max(capacity, 2))
+        self.free.remove(0)
+
+    def _grow(self, capacity):
+        old = self.capacity
+        for name, _ in self.FIELDS + (("used", None),):
+            arr = getattr(self, name)
+            grown = np.zeros(capacity, arr.dtype)
+            grown[:old] = arr
+            setattr(self, name, grown)
+        self.views.extend([None] * (capacity - old))
+        self.free.extend(range(capacity - 1, old - 1, -1))
+        self.capacity = capacity
+
+    def allocate(self, view):
+        if not self.free: self._grow(self.capacity * 2)
+        slot = self.free.pop()
+        self.used[slot] = True
+        self.views[slot] = view
+        return slot
+
+    def release(self, view):
+        slot = view.slot
+        if slot == 0: return
+        self.used[slot] = False
+        self.alive[slot] = False
+        self.views[slot] = None
+        self.free.append(slot)
+        view.slot = 0
+
+    def __len__(self):
+        return self.capacity - 1 - len(self.free)
+
+    def step(self, dt, occupied):
+        """Batch death masking, slow decay and walking. `occupied` is a ROWS x COLS bool
+        array of live plants. Returns the slots that still need a per-zombie pass: those
+        eating, past the lawnmower line, or with a plant under their mouth."""
+        self.alive &= self.used & (self.hp > 0)
+        live = self.alive
+
+        slowed = live & (self.slow_timer > 0)
+        self.slow_timer[slowed] -= dt
+        recovered = slowed & (self.slow_timer <= 0)
+        self.speed[recovered] = self.base_speed[recovered]
+        self.recovered_rows = np.unique(self.row[recovered]).tolist() if recovered.any() else []
+
+        walking = live & ~self.eating
+        self.x[walking] -= self.speed[walking] * dt
+
+        # Column whose plant rect the bite rect (x - 30 .. x - 10) can overlap. Boundary
+        # cases may be flagged spuriously; Zombie._after_move does the exact test.
+        col = (np.floor(self.x - 30) - LAWN_LEFT + 9) // TILE_W
+        on_lawn = (col >= 0) & (col < COLS)
+        col = np.clip(col, 0, COLS - 1).astype(np.intp)
+        row = np.clip(self.row, 0, ROWS - 1)
+        biting = on_lawn & occupied[row, col]
+
+        return np.flatnonzero(live & (self.eating | biting | (self.x < LAWN_LEFT - 15))).tolist()
+
+    def reap(self):
+        """Release every dead zombie's slot. Returns how many were released."""
+        dead = np.flatnonzero(self.used & ~self.alive).tolist()
+        for slot in dead: self.release(self.views[slot])
+        return len(dead)
+
+    def sorted_rows(self):
+        """Live views and their x keys per row, ordered by x (for ZombieIndex.load)."""
+        live = np.flatnonzero(self.alive)
+        order = live[np.lexsort((self.x[live], self.row[live]))]
+        bounds = np.searchsorted(self.row[order], np.arange(ROWS + 1)).tolist()
+        xs = self.x[order].tolist()
+        slots = order.tolist()
+        views = self.views
+        rows, keys = [], []
+        for r in range(ROWS):
+            a, b = bounds[r], bounds[r + 1]
+            rows.append([views[i] for i in slots[a:b]])
+            keys.append(xs[a:b])
+        return rows, keys
+
+
+def _stored_field(name):
+    def get(self): return getattr(self.store, name).item(self.slot)
+    def set(self, value): getattr(self.store, name)[self.slot] = value
+    return property(get, set)
+
+
+class StoredZombie(Zombie):
+    """Zombie whose state lives in a ZombieStore slot. Movement and slow decay are batched."""
+    __slots__ = ("store", "slot")
+
+    def __init__(self, store, row, x):
+        self.store = store
+        self.slot = store.allocate(self)
+        super().__init__(row, x)
+
+    def update(self, dt, game):
+        # Slow decay and walking were already applied by ZombieStore.step() this tick.
+        if not self.alive:
+            return
+        if self.eating:
+            if self._eat(dt, game):
+                return
+            # Target died elsewhere: the batch skipped this zombie, so walk it here.
+            self.x -= self.speed * dt
+        self._after_move(game)
+
+for _name, _ in ZombieStore.FIELDS:
+    setattr(StoredZombie, _name, _stored_field(_name))
+del _name, _
+
+# ------------------------------------------------------------------
+# DIRTY-RECTANGLE RENDERING
+# ------------------------------------------------------------------
+class DirtyTracker:
+    """
+    Collects the screen regions that changed since the last presented frame so only those
+    are pushed with pygame.display.update(rects). Named regions are compared by a key;
+    entities by their draw bounds plus visual_key(). Falls back to a full flip when the
+    dirty area exceeds `threshold` of the screen or after invalidate().
+    """
+    def __init__(self, threshold=0.3):
+        self.threshold = threshold
+        self.screen_area = SCREEN_WIDTH * SCREEN_HEIGHT
+        self.full = True
+        self.rects = []
+        self.regions = {}
+        self.entity_boxes = {}
+        self.stats = {"flips": 0, "partial": 0, "skipped": 0}
+
+    def invalidate(self):
+        self.full = True
+
+    def region(self, name, key, rect):
+        old = self.regions.get(name)
+        if old is None or old[0] != key:
+            if old is not None: self.rects.append(old[1])
+            self.rects.append(rect)
+            self.regions[name] = (key, rect)
+
+    def entities(self, entities):
+        prev = self.entity_boxes
+        boxes = {}
+        for e in entities:
+            # int() in rect() truncates toward zero, so track the drawn position as well.
+            box = (entity_draw_bounds(e), int(e.x), int(e.y), getattr(e, "visual_key", _no_key)())
+            boxes[id(e)] = box
+            old = prev.pop(id(e), None)
+            if old != box:
+                self.rects.append(box[0])
+                if old is not None: self.rects.append(old[0])
+        for old in prev.values(): self.rects.append(old[0])
+        self.entity_boxes = boxes
+
+    def present(self):
+        area = sum(r[2] * r[3] for r in self.rects)
+        if self.full or area > self.threshold * self.screen_area:
+            pygame.display.flip()
+            self.stats["flips"] += 1
+        elif self.rects:
+            pygame.display.update(self.rects)
+            self.stats["partial"] += 1
+        else:
+            self.stats["skipped"] += 1
+        self.full = False
+        self.rects = []
+
+def _no_key(): return None
+
+def entity_draw_bounds(e):
+    # rect() plus room for HP bars, the Cherry Bomb stem, zombie heads and mower wheels, as
+    # an (x, y, w, h) tuple: the tracker keeps it for a frame, so it must not be the box.
+    x, y, w, h = e.rect()
+    return (x - 8, y - 20, w + 16, h + 40)
+
+# ------------------------------------------------------------------
+# ASSET WARMUP
+# ------------------------------------------------------------------
+class AssetWarmup(threading.Thread):
+    """
+    Runs a list of asset-building jobs on a daemon thread (while the main menu is up) and
+    exposes progress for a loading indicator. Surfaces built here are left unconverted;
+    the main thread finishes them in Game._finish_warmup().
+    """
+    def __init__(self, jobs):
+        super().__init__(name="asset-warmup", daemon=True)
+        self.jobs = jobs
+        self.done = 0
+        self.error = None
+
+    @property
+    def progress(self):
+        return self.done / len(self.jobs) if self.jobs else 1.0
+
+    def run(self):
+        try:
+            for job in self.jobs:
+                job()
+                self.done += 1
+        except Exception as e:  # a failed warmup only means assets get built lazily
+            self.error = e
+
 # ------------------------------------------------------------------
 # ALMANAC DATA (Expanded)
 # ------------------------------------------------------------------
@@ -596,59 +1621,223 @@ PLANT_DATA = {
     "Cherry Bomb": {"cls": CherryBomb, "cost": 150, "hp": 100, "desc": "Explodes in 3x3 area. Boom!"},
 }
 
+def card_recharge(cls):
+    # Approximate recharges
+    if cls.name == "Wall-nut": return 15.0
+    if cls.name == "Cherry Bomb": return 25.0
+    return 5.0
+
 ZOMBIE_DATA = {
     "Basic Zombie": {"hp": 200, "speed": "slow", "desc": "Just walks and eats. Nothing special."}
 }
 
+# ------------------------------------------------------------------
+# MEMORY BENCHMARK
+# ------------------------------------------------------------------
+def memory_benchmark(n=10000):
+    """Spawn n of each entity type and measure the heap it takes with tracemalloc (the
+    holding list excluded). Returns rows of (entity, bytes per instance)."""
+    clock = Scheduler()
+    factories = [
+        ("Sun", lambda i: Sun(300.0, 200.0)),
+        ("Projectile", lambda i: Projectile(i % ROWS, 300.0, 200.0)),
+        *((cls.__name__, functools.partial(lambda cls, i: cls(i % ROWS, i % COLS), cls))
+          for cls in (d["cls"] for d in PLANT_DATA.values())),
+        ("Zombie", lambda i: Zombie(i % ROWS, 900.0)),
+        ("LawnMower", lambda i: LawnMower(i % ROWS)),
+        ("SeedCard", lambda i: SeedCard(Peashooter, 0, clock)),
+    ]
+    rows = []
+    for name, make in factories:
+        holder = [None] * n
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(n): holder[i] = make(i)
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        rows.append((name, (after - before) / n))
+        del holder
+    return rows
+
+# ------------------------------------------------------------------
+# ALLOCATION COUNTER
+# ------------------------------------------------------------------
+class RectCounter:
+    """
+    Debug hook counting Rect allocations. While active, pygame.Rect is swapped for a
+    subclass whose __init__ counts, so every pygame.Rect(...) call in the game is seen, and
+    a profile hook counts calls to the pygame C functions that return a fresh Rect (blit,
+    fill, get_rect, every pygame.draw function, Rect.move/inflate/...). tracemalloc can't
+    do this: it only sees blocks still alive, and these Rects die within the frame.
+    Only the calling thread is profiled.
+    """
+    SURFACE_METHODS = frozenset(("blit", "fill", "get_rect", "get_bounding_rect"))
+    RECT_METHODS = frozenset(("copy", "move", "inflate", "clip", "union", "unionall", "fit", "clamp", "scale_by"))
+
+    def __init__(self):
+        self.count = 0
+        self.saved = None
+        self.saved_profile = None
+
+    def _profile(self, frame, event, fn):
+        if event != "c_call": return
+        owner = getattr(fn, "__self__", None)
+        name = fn.__name__
+        if (owner is pygame.draw or (isinstance(owner, pygame.Surface) and name in self.SURFACE_METHODS)
+                or (isinstance(owner, pygame.Rect) and name in self.RECT_METHODS)):
+            self.count += 1
+
+    def __enter__(self):
+        counter = self
+        class CountedRect(pygame.Rect):
+            def __init__(self, *args):
+                counter.count += 1
+                super().__init__(*args)
+        self.saved = pygame.Rect
+        pygame.Rect = CountedRect
+        self.saved_profile = sys.getprofile()
+        sys.setprofile(self._profile)
+        return self
+
+    def __exit__(self, *exc):
+        sys.setprofile(self.saved_profile)
+        pygame.Rect = self.saved
+
+def rect_benchmark(seconds=30.0, warmup=10.0):
+    """Rect allocations during `seconds` of steady-state play on a scripted lawn, rendered
+    at FPS on a dummy display, per collision mode. The frame's update and draw are counted
+    apart. Each entity created in that window (zombies, and peas or suns that grow a pool)
+    owns one box, so the simulation is allocation-free when update == created; drawing
+    still allocates the Rects that blit and pygame.draw return.
+    Returns rows of (mode, frames, update rects, created, draw rects)."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    modes = (("per-pea", {"batch_collisions": False}), ("batched", {}), ("predicted", {"predict_hits": True}))
+    rows = []
+    for name, kwargs in modes:
+        random.seed(0)
+        game = Game(audio=False, asset_cache=False, **kwargs)
+        game.start()
+        for row in range(ROWS):
+            for col, cls in enumerate((SunflowerPlant, Peashooter, Peashooter, SnowPea, Wallnut)):
+                game.place_plant(row, col, cls)
+        game.simulate(warmup)
+        created = game.zombies_spawned + game.projectile_pool.created + game.sun_pool.created
+        frames = round(seconds * FPS)
+        update = draw = 0
+        with RectCounter() as counter:
+            for _ in range(frames):
+                mark = counter.count
+                game.advance(1.0 / FPS)
+                update += counter.count - mark
+                mark = counter.count
+                game.draw()
+                draw += counter.count - mark
+        created = game.zombies_spawned + game.projectile_pool.created + game.sun_pool.created - created
+        rows.append((name, frames, update, created, draw))
+    return rows
+
 # ------------------------------------------------------------------
 # MAIN GAME CLASS
 # ------------------------------------------------------------------
 class Game:
-    def __init__(self):
-        pygame.init()
-        pygame.mixer.init()
-        pygame.display.set_caption("AC'S PVZ Engine - Dynamic Sound & Zen Garden")
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.clock = pygame.time.Clock()
+    def __init__(self, headless=False, zombie_store=False, batch_collisions=True, dirty_rects=False,
+                 asset_cache=True, audio=True, predict_hits=False, profile_systems=False):
+        self.headless = headless
+        self.use_zombie_store = zombie_store
+        self.batch_collisions = batch_collisions
+        self.predict_hits = predict_hits
+        self.plan_seq = itertools.count(1)
         self.running = True
-        
-        # Sound Engine
-        self.sound = SoundManager()
-
-        self.font_large = pygame.font.Font(None, 64)
-        self.font_medium = pygame.font.Font(None, 40)
-        self.font_small = pygame.font.Font(None, 28)
+        self.systems = self._build_systems()
+        self.system_times = {name: 0.0 for name, _ in self.systems} if profile_systems else None
+        self.profiled_ticks = 0
+
+        if headless:
+            # Simulation only: no window, fonts or mixer. Drive it with step()/simulate().
+            self.screen = None
+            self.clock = None
+            self.sound = NullSound()
+            self.font_large = self.font_medium = self.font_small = None
+        else:
+            audio = audio_requested(audio)
+            if audio:
+                # One mixer init, with SoundManager's format, via pygame.init().
+                pygame.mixer.pre_init(44100, -16, 2, 512)
+                pygame.init()
+            else:
+                # Silent: bring up only what the window needs, never the mixer.
+                pygame.display.init()
+                pygame.font.init()
+            pygame.display.set_caption("AC'S PVZ Engine - Dynamic Sound & Zen Garden")
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.clock = pygame.time.Clock()
+
+            # Sound Engine (the bank is built by the warmup thread)
+            self.sound = SoundManager(build=False) if audio else NullSound()
+            if asset_cache:
+                self.sound.disk_cache = sprites.disk_cache = AssetDiskCache()
+
+            self.font_large = pygame.font.Font(None, 64)
+            self.font_medium = pygame.font.Font(None, 40)
+            self.font_small = pygame.font.Font(None, 28)
 
         self.state = "main_menu"
         self.dt = 0.0
+        self.accumulator = 0.0
+        self._static_key = None
+        self._static_surface = None
+        self.dirty = DirtyTracker() if dirty_rects and not headless else None
+        self.warmup = None
+        self.warmed_up = headless
 
         self.menu_selection = 0
         self.almanac_page = 0
         self.almanac_index = 0
 
+        # Peas and suns are recycled across ticks and levels.
+        self.projectile_pool = EntityPool(Projectile)
+        self.sun_pool = EntityPool(Sun)
+        self.suns = EntityList(_sun_live, self.sun_pool.release)
+        self.projectiles = EntityList(_is_alive, self.projectile_pool.release)
+        self.zombies = EntityList(_is_alive)
+
         self.reset_gameplay()
 
+        if not headless:
+            self.warmup = AssetWarmup(self._warmup_jobs())
+            self.warmup.start()
+
     def reset_gameplay(self, mode="adventure"):
+        # The previous level's suns and peas go back to their pools.
         self.sun = START_SUN
-        self.suns = []
-        self.projectiles = []
-        self.zombies = []
+        self.suns.clear()
+        self.projectiles.clear()
+        self.zombies.clear()
+        self.ticking_plants = EntityList(_is_alive)
+        self.shooters = ComponentTable(next_at="d", reload="d", row="i", x="d", y="d", frozen="b")
+        self.sun_producers = ComponentTable(next_at="d", reload="d", x="d", y="d")
+        self.scheduler = Scheduler()
+        self.unplanned = []       # peas fired this tick, planned once zombies have moved
+        self.changed_rows = set() # rows whose zombie set or speeds changed this tick
+        self.zombie_index = ZombieIndex()
+        self.zombie_store = ZombieStore() if self.use_zombie_store else None
         self.plants = {}
+        # Occupancy grid for bite checks; a row's version changes on every place/remove.
+        self.grid = [[None] * COLS for _ in range(ROWS)]
+        self.row_versions = [0] * ROWS
+        self.occupancy = np.zeros((ROWS, COLS), np.bool_) if self.zombie_store is not None else None
         self.selected_card = None
 
         # Dynamically create cards from PLANT_DATA to ensure Almanac and Gameplay match
         plant_classes = [d["cls"] for d in PLANT_DATA.values()]
         self.cards = []
         for i, cls in enumerate(plant_classes):
-            # Approximate recharges
-            cd = 5.0
-            if cls.name == "Wall-nut": cd = 15.0
-            if cls.name == "Cherry Bomb": cd = 25.0
-            self.cards.append(SeedCard(cls, i, recharge=cd))
-
-        self.sky_sun_timer = 2.0
-        self.zombie_timer = 2.0
+            self.cards.append(SeedCard(cls, i, self.scheduler, recharge=card_recharge(cls)))
+
         self.zombie_interval = ZOMBIE_BASE_INTERVAL
+        self.zombies_spawned = 0
+        self.sun_collected = 0
+        self.sun_spent = 0
 
         self.elapsed = 0.0
         self.win = False
@@ -661,17 +1850,128 @@ class Game:
 
         if self.mode == "zen_garden":
             self.sun = 9990 # Infinite sun for Zen Garden
-            self.sky_sun_timer = 1.0 # Fast sun
+            self.scheduler.after(1.0, self._sky_sun) # Fast sun
+        else:
+            self.scheduler.after(2.0, self._sky_sun)
+            self.scheduler.after(2.0, self._spawn_wave_zombie)
+
+    def start(self, mode="adventure"):
+        self._finish_warmup(wait=True)
+        self.reset_gameplay(mode)
+        self.state = "playing"
+
+    def _warmup_jobs(self):
+        """Everything the first playing frame would otherwise build on first use."""
+        jobs = [functools.partial(self.sound.build_effect, name) for name in SoundManager.EFFECTS if self.sound.enabled]
+
+        for cls in (Sun, Projectile, LawnMower, Zombie, *(d["cls"] for d in PLANT_DATA.values())):
+            for variant in cls.SPRITE_VARIANTS:
+                jobs.append(functools.partial(sprites.prepare, cls, variant))
+
+        texts = [(self.font_medium, C_TEXT), (self.font_small, (220, 220, 220))]
+        jobs += [functools.partial(text_cache.digits, font, color) for font, color in texts]
+        labels = [("Time: ", self.font_small, (220, 220, 220)), ("s", self.font_small, (220, 220, 220)),
+                  ("Zen Garden", self.font_medium, (100, 255, 100))]
+        for data in PLANT_DATA.values():
+            labels.append((data["cls"].name, self.font_small, C_TEXT))
+            labels += [(str(data["cost"]), self.font_small, c) for c in (C_ACCENT, C_WARN)]
+        labels += [(m, self.font_small, C_ACCENT) for m in ("Recharging...", "Not enough sun!", "Tile occupied!")]
+        jobs += [functools.partial(text_cache.render, *label) for label in labels]
+        return jobs
+
+    def _finish_warmup(self, wait=False):
+        """Main-thread half of the warmup: convert the prepared sprites and build the static
+        layer. With wait=True, block until the worker is done (e.g. when starting a level)."""
+        if self.warmed_up: return
+        if self.warmup.is_alive():
+            if not wait: return
+            self.warmup.join()
+        sprites.convert_all()
+        self._static_layer()
+        self.warmed_up = True
+
+    def plant_at(self, row, col): return self.grid[row][col]
+    def place_plant(self, row, col, plant_cls):
+        # A plant already on the tile is replaced; retiring it also ends its scheduled callbacks.
+        previous = self.plants.get((row, col))
+        if previous is not None:
+            previous.alive = False
+            self.remove_plant(row, col)
+        plant = plant_cls(row, col)
+        self.plants[(row, col)] = plant
+        self._set_tile(row, col, plant)
+        if plant.TICKS: self.ticking_plants.append(plant)
+        spec = plant.SHOOTER
+        if spec is not None:
+            self.shooters.add(plant, next_at=self.elapsed + random.uniform(*spec.first), reload=spec.reload,
+                              row=row, x=plant.x, y=plant.y, frozen=spec.frozen)
+        spec = plant.SUN_PRODUCER
+        if spec is not None:
+            self.sun_producers.add(plant, next_at=self.elapsed + random.uniform(*spec.first), reload=spec.reload,
+                                   x=plant.x, y=plant.y)
+        return plant
+
+    def buy_plant(self, row, col, card):
+        """Plant from a seed card: pay its cost and start its recharge."""
+        plant = self.place_plant(row, col, card.plant_cls)
+        self.sun -= card.cost
+        self.sun_spent += card.cost
+        card.start_cooldown()
+        return plant
+
+    def spawn_zombie(self, row, x):
+        z = Zombie(row, x) if self.zombie_store is None else StoredZombie(self.zombie_store, row, x)
+        self.zombies.append(z)
+        self.zombie_index.add(z)
+        self.zombies_spawned += 1
+        self.row_changed(row)
+        return z
+
+    def spawn_projectile(self, row, x, y, at=None, **kwargs):
+        pr = self.projectile_pool.acquire(row, x, y, **kwargs)
+        self.projectiles.append(pr)
+        if self.predict_hits:
+            # Fired at `at`, inside this tick: start it back so that after this tick's
+            # advance() it sits where it really is at self.elapsed.
+            if at is None: at = self.elapsed
+            pr.x -= pr.speed * (self.dt - (self.elapsed - at))
+            self.unplanned.append(pr)
+        return pr
+
+    def spawn_sun(self, x, y, **kwargs):
+        s = self.sun_pool.acquire(x, y, **kwargs)
+        self.suns.append(s)
+        return s
+
+    def collect_sun(self, s):
+        self.sun += s.value
+        self.sun_collected += s.value
+        s.life = 0
+        self.suns.compact()
+
+    @property
+    def zombies_killed(self):
+        # Zombies only ever leave the lawn by dying.
+        return self.zombies_spawned - sum(1 for z in self.zombies if z.alive)
+
+    def pool_stats(self):
+        return {"projectiles": self.projectile_pool.stats(), "suns": self.sun_pool.stats()}
+
+    def row_changed(self, row):
+        """A zombie in `row` spawned, died, or changed speed (slow, start/stop eating)."""
+        if self.predict_hits: self.changed_rows.add(row)
 
-    def plant_at(self, row, col): return self.plants.get((row, col))
     def remove_plant(self, row, col):
-        if (row, col) in self.plants: del self.plants[(row, col)]
+        plant = self.plants.pop((row, col), None)
+        if plant is not None:
+            self.shooters.remove(plant)
+            self.sun_producers.remove(plant)
+            self._set_tile(row, col, None)
 
-    def get_plant_colliding(self, row, rect):
-        for c in range(COLS):
-            p = self.plant_at(row, c)
-            if p and p.alive and rect.colliderect(p.rect()): return p
-        return None
+    def _set_tile(self, row, col, plant):
+        self.grid[row][col] = plant
+        self.row_versions[row] += 1
+        if self.occupancy is not None: self.occupancy[row, col] = plant is not None
 
     def trigger_lawnmower(self, row):
         self.lawnmowers[row].trigger()
@@ -693,16 +1993,46 @@ class Game:
 
     def run(self):
         while self.running:
-            self.dt = self.clock.tick(FPS) / 1000.0
+            frame_dt = self.clock.tick(FPS) / 1000.0
             self.handle_events()
-            self.update()
+            self.advance(frame_dt)
+            self.sound.flush()
             self.draw()
         pygame.quit()
         sys.exit()
 
+    def advance(self, frame_dt):
+        """Feed elapsed wall time into the fixed-step clock and run every whole SIM_DT step
+        that has accumulated. At most MAX_CATCHUP_STEPS run per call; past that the backlog
+        is dropped (keeping only the sub-step remainder) so one stall can't snowball."""
+        self.accumulator += frame_dt
+        steps = 0
+        while self.accumulator >= SIM_DT:
+            if steps == MAX_CATCHUP_STEPS:
+                self.accumulator %= SIM_DT
+                break
+            self.step(SIM_DT)
+            self.accumulator -= SIM_DT
+            steps += 1
+        return steps
+
+    def step(self, dt):
+        """Advance the simulation by exactly `dt` seconds (no events, no drawing)."""
+        self.dt = dt
+        self.update()
+
+    def simulate(self, seconds, dt=SIM_DT):
+        """Step the current level for up to `seconds` of game time, as fast as the CPU allows.
+        Stops early when the level ends. Returns the resulting state."""
+        for _ in range(int(round(seconds / dt))):
+            if self.state != "playing": break
+            self.step(dt)
+        return self.state
+
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT: self.running = False
+            if event.type == pygame.VIDEOEXPOSE and self.dirty is not None: self.dirty.invalidate()
 
             if self.state == "main_menu":
                 if event.type == pygame.KEYDOWN:
@@ -746,10 +2076,9 @@ class Game:
                     mx, my = event.pos
 
                     # Sun collection
-                    for s in list(self.suns):
+                    for s in self.suns:
                         if s.rect().collidepoint((mx, my)):
-                            self.sun += s.value
-                            self.suns.remove(s)
+                            self.collect_sun(s)
                             self.sound.play_sun_collect()
                             return
 
@@ -770,10 +2099,7 @@ class Game:
                         card = self.selected_card
                         if self.sun < card.cost: self.show_message("Not enough sun!", 0.9); return
                         
-                        plant = card.plant_cls(row, col)
-                        self.plants[(row, col)] = plant
-                        self.sun -= card.cost
-                        card.start_cooldown()
+                        self.buy_plant(row, col, card)
                         self.sound.play_plant()
                         self.selected_card = None
                         return
@@ -781,19 +2107,16 @@ class Game:
             elif self.state in ("game_over", "win"):
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_r:
-                        self.reset_gameplay(self.mode)
-                        self.state = "playing"
+                        self.start(self.mode)
                     elif event.key == pygame.K_ESCAPE: self.state = "main_menu"
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     self.state = "main_menu"
 
     def _activate_menu_option(self):
         if self.menu_selection == 0:
-            self.reset_gameplay("adventure")
-            self.state = "playing"
+            self.start("adventure")
         elif self.menu_selection == 1:
-            self.reset_gameplay("zen_garden") # Changed from minigames
-            self.state = "playing"
+            self.start("zen_garden") # Changed from minigames
         elif self.menu_selection == 2:
             self.almanac_page = 0
             self.almanac_index = 0
@@ -803,8 +2126,44 @@ class Game:
 
     def update(self):
         if self.state != "playing": return
-
         dt = self.dt
+        times = self.system_times
+        if times is None:
+            for _, system in self.systems: system(dt)
+        else:
+            for name, system in self.systems:
+                t0 = time.perf_counter()
+                system(dt)
+                times[name] += time.perf_counter() - t0
+            self.profiled_ticks += 1
+
+    def _build_systems(self):
+        """The tick as an ordered list of (name, system(dt)). Mode flags pick the variant of
+        each stage once here instead of being re-tested every tick."""
+        if self.predict_hits: projectiles = self._fly_projectiles
+        elif self.batch_collisions: projectiles = self._batch_projectiles
+        else: projectiles = self._step_projectiles
+        systems = [
+            ("clock", self._run_clock),
+            ("suns", self._run_suns),
+            ("timers", self._run_timers),
+            ("shooters", self._run_shooters),
+            ("sun_producers", self._run_sun_producers),
+            ("ticking_plants", self._run_ticking_plants),
+            ("projectiles", projectiles),
+            ("zombies", self._update_stored_zombies if self.use_zombie_store else self._run_zombies),
+            ("lawnmowers", self._run_lawnmowers),
+        ]
+        if self.predict_hits: systems.append(("shot_planning", self._plan_shots))
+        systems.append(("sound", self._flush_sound))
+        return systems
+
+    def profile_report(self):
+        """Rows of (system, ms per tick) from the ticks run with profile_systems=True."""
+        ticks = max(self.profiled_ticks, 1)
+        return [(name, t / ticks * 1000.0) for name, t in self.system_times.items()]
+
+    def _run_clock(self, dt):
         self.elapsed += dt
 
         # Zen Garden specific logic
@@ -818,47 +2177,154 @@ class Game:
             self.message_timer -= dt
             if self.message_timer <= 0: self.message = ""
 
-        for c in self.cards: c.update(dt)
-
-        # Sky sun logic
-        self.sky_sun_timer -= dt
-        if self.sky_sun_timer <= 0:
-            sx = random.randint(LAWN_LEFT + 30, LAWN_LEFT + LAWN_W - 30)
-            ty = random.randint(LAWN_TOP + 30, LAWN_TOP + LAWN_H - 30)
-            self.suns.append(Sun(sx, -20, value=SUN_VALUE, vy=0, target_y=ty, life=11.0, floating=False))
-            interval = SKY_SUN_INTERVAL if self.mode != "zen_garden" else 4.0
-            self.sky_sun_timer = interval + random.uniform(-1.5, 1.5)
-
-        # Zombie spawning (Skip for Zen Garden)
-        if self.mode != "zen_garden":
-            self.zombie_interval = max(ZOMBIE_MIN_INTERVAL, self.zombie_interval - ZOMBIE_INTERVAL_DECAY * dt)
-            self.zombie_timer -= dt
-            if self.zombie_timer <= 0:
-                row = random.randrange(ROWS)
-                zx = LAWN_LEFT + LAWN_W + 60
-                self.zombies.append(Zombie(row, zx))
-                self.zombie_timer = self.zombie_interval + random.uniform(-0.4, 0.6)
-
-        # Updates
-        for s in list(self.suns):
-            s.update(dt)
-            if s.life <= 0: self.suns.remove(s)
-
-        for (row, col), p in list(self.plants.items()):
-            if not p.alive: self.remove_plant(row, col); continue
-            p.update(dt, self)
-
-        for pr in list(self.projectiles):
-            pr.update(dt, self)
-            if not pr.alive: self.projectiles.remove(pr)
-
-        for z in list(self.zombies): z.update(dt, self)
-        self.zombies = [z for z in self.zombies if z.alive]
-
+    def _run_suns(self, dt):
+        for s in self.suns: s.update(dt)
+        self.suns.compact()
+
+    def _run_timers(self, dt):
+        # Level-wide timed actions (sky suns, zombie spawns) that are due now.
+        self.scheduler.run_due(self.elapsed)
+
+    def _run_shooters(self, dt):
+        t = self.shooters
+        for i in t.due(self.elapsed):
+            at, row, x = t.next_at[i], t.row[i], t.x[i]
+            if self.zombie_index.has_target(row, x):
+                self.spawn_projectile(row, x + 25, t.y[i] - 10, at=at, is_frozen=bool(t.frozen[i]))
+                self.sound.play_shoot()
+            t.next_at[i] = at + t.reload[i]
+
+    def _run_sun_producers(self, dt):
+        t = self.sun_producers
+        for i in t.due(self.elapsed):
+            sx = t.x[i] + random.uniform(-10, 10)
+            sy = t.y[i] - 10
+            self.spawn_sun(sx, sy, value=SUN_VALUE, vy=-80, target_y=sy, life=9.0, floating=True)
+            t.next_at[i] += t.reload[i]
+
+    def _run_ticking_plants(self, dt):
+        for p in self.ticking_plants: p.update(dt, self)
+        self.ticking_plants.compact()
+
+    def _fly_projectiles(self, dt):
+        # Hits were applied by scheduled events; peas only need to fly.
+        for pr in self.projectiles: pr.advance(dt)
+        self.projectiles.compact()
+
+    def _batch_projectiles(self, dt):
+        if len(self.projectiles) < BATCH_COLLISION_MIN: return self._step_projectiles(dt)
+        for pr in self.projectiles: pr.advance(dt)
+        self._resolve_projectile_hits()
+        self.projectiles.compact()
+
+    def _step_projectiles(self, dt):
+        for pr in self.projectiles: pr.update(dt, self)
+        self.projectiles.compact()
+
+    def _run_zombies(self, dt):
+        for z in self.zombies: z.update(dt, self)
+        self.zombies.compact()
+        self.zombie_index.resort()
+
+    def _run_lawnmowers(self, dt):
         for m in self.lawnmowers: m.update(dt, self)
 
+    def _flush_sound(self, dt):
+        self.sound.flush()
+
+    def _sky_sun(self):
+        sx = random.randint(LAWN_LEFT + 30, LAWN_LEFT + LAWN_W - 30)
+        ty = random.randint(LAWN_TOP + 30, LAWN_TOP + LAWN_H - 30)
+        self.spawn_sun(sx, -20, value=SUN_VALUE, vy=0, target_y=ty, life=11.0, floating=False)
+        interval = SKY_SUN_INTERVAL if self.mode != "zen_garden" else 4.0
+        self.scheduler.after(interval + random.uniform(-1.5, 1.5), self._sky_sun)
+
+    def _spawn_wave_zombie(self):
+        # The spawn interval shrinks linearly with level time down to ZOMBIE_MIN_INTERVAL.
+        self.zombie_interval = max(ZOMBIE_MIN_INTERVAL, ZOMBIE_BASE_INTERVAL - ZOMBIE_INTERVAL_DECAY * self.elapsed)
+        row = random.randrange(ROWS)
+        zx = LAWN_LEFT + LAWN_W + 60
+        self.spawn_zombie(row, zx)
+        self.scheduler.after(self.zombie_interval + random.uniform(-0.4, 0.6), self._spawn_wave_zombie)
+
+    def _plan_shots(self, dt):
+        """Plan this tick's new peas and re-plan every pea in a row whose zombies changed."""
+        if self.zombie_store is not None: self.changed_rows.update(self.zombie_store.recovered_rows)
+        if self.changed_rows:
+            rows = self.changed_rows
+            for pr in self.projectiles:
+                if pr.alive and pr.row in rows: self._plan_shot(pr)
+            self.changed_rows = set()
+        for pr in self.unplanned:
+            if pr.alive: self._plan_shot(pr)
+        self.unplanned.clear()
+
+    def _plan_shot(self, pr):
+        """
+        Time of impact of pea `pr` with each zombie in its row, assuming current speeds hold:
+        the gap between centers closes at pea speed + zombie walk speed until it drops below
+        HIT_SPAN. The earliest hit before the pea leaves the screen is scheduled; any earlier
+        plan for this pea is invalidated by its new token.
+        """
+        pr.plan = token = next(self.plan_seq)
+        best_t, best_z = (SCREEN_WIDTH + 30 - pr.x) / pr.speed, None
+        for z in self.zombie_index.rows[pr.row]:
+            if not z.alive: continue
+            gap = z.x - pr.x
+            if gap <= -HIT_SPAN: continue  # already behind the pea
+            t = max(0.0, (gap - HIT_SPAN) / (pr.speed + z.walk_speed()))
+            if t < best_t: best_t, best_z = t, z
+        if best_z is not None:
+            self.scheduler.at(self.elapsed + best_t, self._predicted_hit, pr, best_z, token)
+
+    def _predicted_hit(self, pr, z, token):
+        # A target that died first has already marked the row for re-planning.
+        if pr.plan != token or not pr.alive or not z.alive: return
+        pr.hit(z, self)
+
+    def _resolve_projectile_hits(self):
+        """Batched collision stage: every live pea against every zombie in one NumPy pass.
+        Hits are then applied in projectile order; if the chosen zombie already died this
+        tick the pea walks on to the next overlapping zombie, as the per-pea path would."""
+        peas = [pr for pr in self.projectiles if pr.alive]
+        rows = self.zombie_index.rows
+        zombies = list(itertools.chain.from_iterable(rows))
+        if not peas or not zombies: return
+
+        # Index keys are current here: zombies only move in the zombie phase.
+        z_x = np.fromiter(itertools.chain.from_iterable(self.zombie_index.keys), np.float64, len(zombies))
+        z_rows = np.repeat(np.arange(ROWS), [len(r) for r in rows])
+        z_keys = z_rows * KEY_STRIDE + np.trunc(z_x - 24)
+        p_rows = np.fromiter((pr.row for pr in peas), np.float64, len(peas))
+        p_lefts = np.trunc(np.fromiter((pr.x for pr in peas), np.float64, len(peas)) - 10)
+
+        first, limit = first_overlaps(p_rows, p_lefts, z_keys)
+        overlap = np.append(z_keys, np.inf)[first] < limit
+        first_l = first.tolist()
+        limit_l = limit.tolist()
+        keys_l = z_keys.tolist()
+        n = len(zombies)
+        for k in np.flatnonzero(overlap).tolist():
+            j = first_l[k]
+            while j < n and keys_l[j] < limit_l[k]:
+                z = zombies[j]
+                if z.alive:
+                    peas[k].hit(z, self)
+                    break
+                j += 1
+
+    def _update_stored_zombies(self, dt):
+        store = self.zombie_store
+        views = store.views
+        for slot in store.step(dt, self.occupancy):
+            views[slot].update(dt, self)
+        if store.reap():
+            self.zombies.compact()
+        self.zombie_index.load(*store.sorted_rows())
+
     def draw(self):
-        self.screen.fill(C_BG)
+        # The playing views blit a full-screen static layer, so only the menus need a clear.
+        if self.state in ("main_menu", "almanac"): self.screen.fill(C_BG)
         if self.state == "main_menu": self.draw_main_menu()
         elif self.state == "almanac": self.draw_almanac()
         elif self.state == "playing": self.draw_playing()
@@ -868,7 +2334,40 @@ class Game:
         elif self.state == "win":
             self.draw_playing()
             self.draw_overlay("YOU WIN!", "Press R to Replay • Click to Menu")
-        pygame.display.flip()
+        if self.dirty is None:
+            pygame.display.flip()
+        else:
+            self._present_dirty()
+
+    def _present_dirty(self):
+        d = self.dirty
+        screen_rect = self.screen.get_rect()
+        if self.state in ("main_menu", "almanac"):
+            # Static screens: push once per selection change, otherwise nothing.
+            loading = None if self.warmed_up else int(self.warmup.progress * 100)
+            d.region("view", (self.state, self.menu_selection, self.almanac_page, self.almanac_index, loading), screen_rect)
+            d.present()
+            return
+
+        d.region("view", self.state, screen_rect)
+        d.region("sun", self.sun, SUN_BOX)
+        if self.mode != "zen_garden":
+            d.region("time", max(0, int(LEVEL_DURATION - self.elapsed)), (SCREEN_WIDTH - 180, 35, 180, 40))
+        for card in self.cards:
+            overlay_h = int(card.rect.height * clamp(card.cooldown / card.recharge, 0, 1)) if card.cooldown > 0 else 0
+            # The grey background outlasts the overlay by up to one pixel row of recharge.
+            key = (card.cooldown > 0, overlay_h, self.selected_card is card, self.sun >= card.cost)
+            d.region(("card", card.index), key, card.rect)
+        d.region("message", self.message, (0, 125, SCREEN_WIDTH, 30))
+
+        ghost = None
+        if self.selected_card:
+            cell = world_to_grid(*pygame.mouse.get_pos())
+            if cell: ghost = (LAWN_LEFT + cell[1] * TILE_W, LAWN_TOP + cell[0] * TILE_H, TILE_W, TILE_H)
+        d.region("ghost", ghost, ghost or (0, 0, 0, 0))
+
+        d.entities(itertools.chain(self.lawnmowers, self.plants.values(), self.projectiles, self.zombies, self.suns))
+        d.present()
 
     def draw_main_menu(self):
         # Sky
@@ -880,6 +2379,14 @@ class Game:
         title = "AC'S PVZ ENGINE"
         draw_text(self.screen, title, self.font_large, MENU_TITLE, SCREEN_WIDTH//2, 120)
 
+        # Asset warmup progress
+        self._finish_warmup()
+        if not self.warmed_up:
+            bar = pygame.Rect(SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT - 50, 300, 10)
+            pygame.draw.rect(self.screen, MENU_BUTTON_SHADOW, bar, border_radius=5)
+            pygame.draw.rect(self.screen, MENU_TITLE, (bar.x, bar.y, int(bar.w * self.warmup.progress), bar.h), border_radius=5)
+            draw_text(self.screen, "Loading...", self.font_small, C_TEXT, bar.centerx, bar.y - 16)
+
         # Buttons
         items = ["Adventure", "Zen Garden", "Almanac", "Quit"]
         y_start = 250
@@ -944,39 +2451,56 @@ class Game:
 
         draw_text(self.screen, "<- -> Browse   TAB Switch   ESC Return", self.font_small, (150,150,150), SCREEN_WIDTH//2, SCREEN_HEIGHT - 40)
 
+    def _static_layer(self):
+        """Everything in the playing view that never changes (panel, sun box frame, lawn
+        checkerboard and grid lines), rendered once and rebuilt only when the layout constants
+        change. The mode label overlaps the last card, so it stays in the per-frame pass."""
+        key = (SCREEN_WIDTH, SCREEN_HEIGHT, LAWN_LEFT, LAWN_TOP, ROWS, COLS, TILE_W, TILE_H, SUN_BOX)
+        if self._static_key != key:
+            surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            surf.fill(C_BG)
+
+            # UI Top Bar
+            pygame.draw.rect(surf, C_PANEL, (0, 0, SCREEN_WIDTH, 110))
+
+            # Sun Counter frame
+            sun_box = pygame.Rect(SUN_BOX)
+            pygame.draw.rect(surf, (60, 60, 30), sun_box, border_radius=12)
+            pygame.draw.circle(surf, C_SUN, (sun_box.x + 32, sun_box.centery), 16)
+
+            # Lawn
+            lawn_rect = pygame.Rect(LAWN_LEFT, LAWN_TOP, LAWN_W, LAWN_H)
+            pygame.draw.rect(surf, C_LAWN, lawn_rect)
+
+            for r in range(ROWS):
+                for c in range(COLS):
+                    x = LAWN_LEFT + c * TILE_W
+                    y = LAWN_TOP + r * TILE_H
+                    tile = pygame.Rect(x, y, TILE_W, TILE_H)
+                    col = C_TILE_A if (r + c) % 2 == 0 else C_TILE_B
+                    pygame.draw.rect(surf, col, tile)
+                    pygame.draw.rect(surf, C_GRID_LINE, tile, 1)
+
+            self._static_surface = surf
+            self._static_key = key
+        return self._static_surface
+
     def draw_playing(self):
-        # UI Top Bar
-        pygame.draw.rect(self.screen, C_PANEL, (0, 0, SCREEN_WIDTH, 110))
-        
+        self.screen.blit(self._static_layer(), (0, 0))
+
         # Cards
         for card in self.cards:
             card.draw(self.screen, self.font_small, selected=(self.selected_card is card), can_afford=(self.sun >= card.cost))
 
         # Sun Counter
-        sun_box = pygame.Rect(30, 22, 140, 70)
-        pygame.draw.rect(self.screen, (60, 60, 30), sun_box, border_radius=12)
-        pygame.draw.circle(self.screen, C_SUN, (sun_box.x + 32, sun_box.centery), 16)
-        draw_text(self.screen, str(self.sun), self.font_medium, C_TEXT, sun_box.x + 92, sun_box.centery)
+        draw_number(self.screen, self.sun, self.font_medium, C_TEXT, SUN_BOX[0] + 92, SUN_BOX[1] + SUN_BOX[3] // 2)
 
         # Mode Label
         if self.mode == "zen_garden":
             draw_text(self.screen, "Zen Garden", self.font_medium, (100, 255, 100), SCREEN_WIDTH - 100, 50)
         else:
             remaining = max(0, int(LEVEL_DURATION - self.elapsed))
-            draw_text(self.screen, f"Time: {remaining}s", self.font_small, (220,220,220), SCREEN_WIDTH - 90, 55)
-
-        # Lawn
-        lawn_rect = pygame.Rect(LAWN_LEFT, LAWN_TOP, LAWN_W, LAWN_H)
-        pygame.draw.rect(self.screen, C_LAWN, lawn_rect)
-        
-        for r in range(ROWS):
-            for c in range(COLS):
-                x = LAWN_LEFT + c * TILE_W
-                y = LAWN_TOP + r * TILE_H
-                tile = pygame.Rect(x, y, TILE_W, TILE_H)
-                col = C_TILE_A if (r + c) % 2 == 0 else C_TILE_B
-                pygame.draw.rect(self.screen, col, tile)
-                pygame.draw.rect(self.screen, C_GRID_LINE, tile, 1)
+            draw_number(self.screen, remaining, self.font_small, (220,220,220), SCREEN_WIDTH - 90, 55, prefix="Time: ", suffix="s")
 
         # Ghost plant preview
         if self.selected_card:
@@ -986,8 +2510,7 @@ class Game:
                 r, c = cell
                 x = LAWN_LEFT + c * TILE_W
                 y = LAWN_TOP + r * TILE_H
-                tile = pygame.Rect(x, y, TILE_W, TILE_H)
-                pygame.draw.rect(self.screen, (255, 255, 255), tile, 3)
+                pygame.draw.rect(self.screen, (255, 255, 255), (x, y, TILE_W, TILE_H), 3)
 
         # Entities
         for m in self.lawnmowers: m.draw(self.screen)
@@ -1008,5 +2531,597 @@ class Game:
         draw_text(self.screen, title, self.font_large, C_ACCENT, box.centerx, box.y + 70)
         draw_text(self.screen, subtitle, self.font_small, (230, 230, 230), box.centerx, box.y + 140)
 
+# ------------------------------------------------------------------
+# VECTORIZED LAWNS (batched training environment)
+# ------------------------------------------------------------------
+PLANT_TYPES = tuple(d["cls"] for d in PLANT_DATA.values())
+
+def _plant_table(value, dtype=float):
+    """Per plant-type lookup indexed by type id (0 = empty tile, i + 1 = PLANT_TYPES[i])."""
+    return np.array([0] + [value(cls) for cls in PLANT_TYPES], dtype=dtype)
+
+class VectorGame:
+    """
+    N independent adventure lawns stepped together. All state lives in NumPy arrays whose
+    leading axis is the game, so one step advances every lawn with a fixed number of array
+    operations instead of N Game objects.
+
+    Rules and tuning are Game's, simplified where batching needs it: sun is credited the
+    moment it is produced (nothing to click), peas reaching a zombie in the same tick all
+    land, and each lawn holds at most `max_zombies` zombies and `max_peas` peas (spawns
+    beyond that are dropped).
+
+    Actions are one int per game: 0 does nothing, 1 + (plant * ROWS + row) * COLS + col
+    plants PLANT_TYPES[plant] on that tile. Placements on an occupied tile, without the sun
+    or with the card recharging are ignored; ids outside [0, ACTIONS) raise ValueError
+    before anything moves. Rewards are +1 for a win, -1 for a loss and
+    KILL_REWARD per zombie killed. Finished lawns are reset before step() returns, so the
+    observation for a done game is the first one of its next episode.
+    """
+    # A mower (56px) and a zombie (48px) touch while their centers are closer than this.
+    MOWER_REACH = 28 + 24
+
+    KILL_REWARD = 0.01
+    ACTIONS = 1 + len(PLANT_TYPES) * ROWS * COLS
+
+    def __init__(self, num_games, seed=None, dt=SIM_DT, ticks_per_step=1, max_zombies=64, max_peas=96):
+        self.n = num_games
+        self.dt = dt
+        self.ticks_per_step = ticks_per_step
+        self.rng = np.random.default_rng(seed)
+
+        self.cost = _plant_table(lambda cls: cls.cost)
+        self.max_hp = _plant_table(lambda cls: cls.max_hp)
+        self.hp_scale = np.divide(1.0, self.max_hp, out=np.zeros_like(self.max_hp), where=self.max_hp > 0)
+        self.recharge = np.array([card_recharge(cls) for cls in PLANT_TYPES])
+        self.is_sunflower = _plant_table(lambda cls: cls.SUN_PRODUCER is not None, bool)
+        self.is_shooter = _plant_table(lambda cls: cls.SHOOTER is not None, bool)
+        self.is_frozen = _plant_table(lambda cls: cls.SHOOTER is not None and cls.SHOOTER.frozen, bool)
+        self.is_cherry = _plant_table(lambda cls: issubclass(cls, CherryBomb), bool)
+        self.has_timer = self.is_sunflower | self.is_shooter | self.is_cherry
+        timed = lambda cls: cls.SUN_PRODUCER or cls.SHOOTER
+        self.reload = _plant_table(lambda cls: timed(cls).reload if timed(cls) else 0.0)
+        first = lambda cls: timed(cls).first if timed(cls) else (getattr(cls, "FUSE", 0.0),) * 2
+        self.first_lo = _plant_table(lambda cls: first(cls)[0])
+        self.first_hi = _plant_table(lambda cls: first(cls)[1])
+        self.tile_x = np.array([grid_to_world(0, c)[0] for c in range(COLS)], dtype=float)
+
+        n, shape = num_games, (num_games, ROWS, COLS)
+        self.sun = np.zeros(n, dtype=np.int64)
+        self.elapsed = np.zeros(n)
+        self.sky_timer = np.zeros(n)
+        self.zombie_timer = np.zeros(n)
+        self.card_ready = np.zeros((n, len(PLANT_TYPES)))  # elapsed time each card is usable again
+        self.plant = np.zeros(shape, dtype=np.int8)
+        self.plant_hp = np.zeros(shape)
+        self.plant_timer = np.zeros(shape)
+        self.z_alive = np.zeros((n, max_zombies), dtype=bool)
+        self.z_row = np.zeros((n, max_zombies), dtype=np.int64)
+        self.z_x = np.zeros((n, max_zombies))
+        self.z_hp = np.zeros((n, max_zombies))
+        self.z_base = np.zeros((n, max_zombies))
+        self.z_speed = np.zeros((n, max_zombies))
+        self.z_slow = np.zeros((n, max_zombies))
+        self.p_alive = np.zeros((n, max_peas), dtype=bool)
+        self.p_row = np.zeros((n, max_peas), dtype=np.int64)
+        self.p_x = np.zeros((n, max_peas))
+        self.p_frozen = np.zeros((n, max_peas), dtype=bool)
+        self.mower_x = np.zeros((n, ROWS))
+        self.mower_state = np.zeros((n, ROWS), dtype=np.int8)  # 0 ready, 1 mowing, 2 used
+
+        # Per-tick results, reset by step()
+        self.killed = np.zeros(n, dtype=np.int64)
+        self.won = np.zeros(n, dtype=bool)
+        self.lost = np.zeros(n, dtype=bool)
+        self.episodes = 0
+        self.reset()
+
+    @classmethod
+    def action(cls, plant_cls, row, col):
+        """Action id planting plant_cls on (row, col)."""
+        return 1 + (PLANT_TYPES.index(plant_cls) * ROWS + row) * COLS + col
+
+    def reset(self, mask=None):
+        """Start fresh lawns for the games in mask (all of them by default)."""
+        if mask is None: mask = np.ones(self.n, dtype=bool)
+        self.sun[mask] = START_SUN
+        self.elapsed[mask] = 0.0
+        self.sky_timer[mask] = 2.0
+        self.zombie_timer[mask] = 2.0
+        self.card_ready[mask] = 0.0
+        self.plant[mask] = 0
+        self.plant_hp[mask] = 0.0
+        self.z_alive[mask] = False
+        self.p_alive[mask] = False
+        self.mower_x[mask] = LAWN_LEFT - 70
+        self.mower_state[mask] = 0
+        return self.observe()
+
+    def step(self, actions):
+        """Apply one action per game, advance ticks_per_step ticks and auto-reset finished
+        games. Returns (observations, rewards, dones)."""
+        self._place(np.asarray(actions))
+        rewards = np.zeros(self.n)
+        dones = np.zeros(self.n, dtype=bool)
+        for _ in range(self.ticks_per_step):
+            self._tick(self.dt)
+            # A lawn that finished mid-step keeps ticking until the reset, but earns nothing.
+            live = ~dones
+            rewards += live * (self.KILL_REWARD * self.killed + self.won - self.lost)
+            dones |= self.won | self.lost
+        if dones.any():
+            self.episodes += int(dones.sum())
+            self.reset(dones)
+        return self.observe(), rewards, dones
+
+    def observe(self):
+        """
+        Per-game observation arrays: sun, elapsed level time, card recharge left, plant type
+        ids and HP fraction per tile, and live zombie HP summed per tile (the last column
+        collects zombies still right of the lawn).
+        """
+        live = np.flatnonzero(self.z_alive)
+        x, row, game = self.z_x.ravel()[live], self.z_row.ravel()[live], live // self.z_alive.shape[1]
+        col = np.minimum(np.maximum(x - LAWN_LEFT, 0) // TILE_W, COLS).astype(np.int64)
+        zombie_hp = np.bincount((game * ROWS + row) * (COLS + 1) + col, weights=self.z_hp.ravel()[live],
+                                minlength=self.n * ROWS * (COLS + 1)).reshape(self.n, ROWS, COLS + 1)
+        return {
+            "sun": self.sun.copy(),
+            "elapsed": self.elapsed.copy(),
+            "cooldowns": np.maximum(self.card_ready - self.elapsed[:, None], 0.0),
+            "plants": self.plant.copy(),
+            "plant_hp": self.plant_hp * np.take(self.hp_scale, self.plant),
+            "zombie_hp": zombie_hp,
+        }
+
+    def _place(self, actions):
+        if actions.shape != (self.n,):
+            raise ValueError(f"expected {self.n} actions, got shape {actions.shape}")
+        bad = (actions < 0) | (actions >= self.ACTIONS)
+        if bad.any():
+            raise ValueError(f"action ids must be in [0, {self.ACTIONS}), got {actions[bad][0]} "
+                             f"for game {np.flatnonzero(bad)[0]}")
+        games = np.flatnonzero(actions > 0)
+        if not len(games): return
+        a = actions[games] - 1
+        kind, tile = a // (ROWS * COLS) + 1, a % (ROWS * COLS)
+        row, col = tile // COLS, tile % COLS
+        ok = ((self.plant[games, row, col] == 0) & (self.sun[games] >= self.cost[kind])
+              & (self.card_ready[games, kind - 1] <= self.elapsed[games]))
+        games, kind, row, col = games[ok], kind[ok], row[ok], col[ok]
+        self.plant[games, row, col] = kind
+        self.plant_hp[games, row, col] = self.max_hp[kind]
+        self.plant_timer[games, row, col] = self.rng.uniform(self.first_lo[kind], self.first_hi[kind])
+        self.sun[games] -= self.cost[kind].astype(np.int64)
+        self.card_ready[games, kind - 1] = self.elapsed[games] + self.recharge[kind - 1]
+
+    # The tick works on flat views of the live zombies and peas only: slots are mostly empty,
+    # and a gather of the live ones is far cheaper than a pass over every (game, slot).
+    def _live_zombies(self):
+        """Flat slot indices, game and (game, row) lane of every live zombie."""
+        live = np.flatnonzero(self.z_alive)
+        game = live // self.z_alive.shape[1]
+        return live, game, game * ROWS + self.z_row.ravel()[live]
+
+    def _tick(self, dt):
+        self.killed[:] = 0
+        self.elapsed += dt
+        self._sky_sun(dt)
+        self._spawn_zombies(dt)
+        self._run_plants(dt)
+        self._run_peas(dt)
+        self._run_zombies(dt)
+        self._run_mowers(dt)
+        live, game, _ = self._live_zombies()
+        self.lost = np.bincount(game[self.z_x.ravel()[live] < 90], minlength=self.n) > 0
+        self.won = ~self.lost & (self.elapsed >= LEVEL_DURATION)
+
+    def _sky_sun(self, dt):
+        self.sky_timer -= dt
+        due = self.sky_timer <= 0
+        if not due.any(): return
+        self.sun[due] += SUN_VALUE
+        self.sky_timer[due] = SKY_SUN_INTERVAL + self.rng.uniform(-1.5, 1.5, due.sum())
+
+    def _spawn_zombies(self, dt):
+        self.zombie_timer -= dt
+        games = np.flatnonzero(self.zombie_timer <= 0)
+        if not len(games): return
+        interval = np.maximum(ZOMBIE_MIN_INTERVAL, ZOMBIE_BASE_INTERVAL - ZOMBIE_INTERVAL_DECAY * self.elapsed[games])
+        self.zombie_timer[games] = interval + self.rng.uniform(-0.4, 0.6, len(games))
+        slot = np.argmin(self.z_alive[games], axis=1)  # first free slot
+        free = ~self.z_alive[games, slot]
+        games, slot = games[free], slot[free]
+        k = len(games)
+        speed = self.rng.uniform(*Zombie.SPEED, k)
+        self.z_alive[games, slot] = True
+        self.z_row[games, slot] = self.rng.integers(0, ROWS, k)
+        self.z_x[games, slot] = LAWN_LEFT + LAWN_W + 60
+        self.z_hp[games, slot] = Zombie.MAX_HP
+        self.z_base[games, slot] = speed
+        self.z_speed[games, slot] = speed
+        self.z_slow[games, slot] = 0.0
+
+    def _run_plants(self, dt):
+        self.plant_timer -= dt
+        fired = np.flatnonzero((self.plant_timer.ravel() <= 0) & self.has_timer[self.plant.ravel()])
+        if not len(fired): return
+        kind = self.plant.ravel()[fired]
+        self.plant_timer.ravel()[fired] = self.reload[kind]
+        lane, c = fired // COLS, fired % COLS
+        g = lane // ROWS
+
+        sunny = self.is_sunflower[kind]
+        if sunny.any(): np.add.at(self.sun, g[sunny], SUN_VALUE)
+
+        shoot = self.is_shooter[kind]
+        if shoot.any():
+            # Fire only with a zombie somewhere to the right in the lane
+            live, _, z_lane = self._live_zombies()
+            front = np.full(self.n * ROWS, -np.inf)
+            np.maximum.at(front, z_lane, self.z_x.ravel()[live])
+            shoot &= front[lane] > self.tile_x[c]
+            self._spawn_peas(g[shoot], lane[shoot] % ROWS, self.tile_x[c[shoot]] + 25, self.is_frozen[kind[shoot]])
+
+        boom = self.is_cherry[kind]
+        if boom.any():
+            live, game, z_lane = self._live_zombies()
+            x = self.z_x.ravel()[live]
+            for t, tx in zip(fired[boom], self.tile_x[c[boom]]):
+                tg = t // (ROWS * COLS)
+                near = (game == tg) & (np.abs(z_lane - t // COLS) <= 1) & (np.abs(x - tx) < CherryBomb.REACH)
+                self.z_hp.ravel()[live[near]] = 0.0
+            self.plant.ravel()[fired[boom]] = 0
+            self._reap_zombies(live, game)
+
+    def _spawn_peas(self, g, r, x, frozen):
+        """Put new peas into each game's free slots, in order; extras are dropped."""
+        if not len(g): return
+        rank = np.arange(len(g)) - np.searchsorted(g, g)  # g is sorted: index within its game
+        free = np.argsort(self.p_alive[g], axis=1, kind="stable")[np.arange(len(g)), np.minimum(rank, self.p_alive.shape[1] - 1)]
+        ok = ~self.p_alive[g, free] & (rank < self.p_alive.shape[1])
+        g, slot = g[ok], free[ok]
+        self.p_alive[g, slot] = True
+        self.p_row[g, slot] = r[ok]
+        self.p_x[g, slot] = x[ok]
+        self.p_frozen[g, slot] = frozen[ok]
+
+    def _run_peas(self, dt):
+        peas = np.flatnonzero(self.p_alive)
+        if not len(peas): return
+        p_x = self.p_x.ravel()
+        p_x[peas] += Projectile.SPEED * dt
+        gone = peas[p_x[peas] > SCREEN_WIDTH + 30]
+        self.p_alive.ravel()[gone] = False
+        peas = peas[p_x[peas] <= SCREEN_WIDTH + 30]
+        live, game, z_lane = self._live_zombies()
+        if not len(peas) or not len(live): return
+        # One sort of every live zombie by (lane, x); each pea hits the leftmost zombie
+        # within HIT_SPAN in its own lane.
+        z_keys = z_lane * KEY_STRIDE + self.z_x.ravel()[live]
+        order = np.argsort(z_keys)
+        z_keys, hit_slot = z_keys[order], live[order]
+        p_keys = ((peas // self.p_alive.shape[1]) * ROWS + self.p_row.ravel()[peas]) * KEY_STRIDE + p_x[peas]
+        j = np.minimum(np.searchsorted(z_keys, p_keys - HIT_SPAN, side="right"), len(z_keys) - 1)
+        hit = np.abs(z_keys[j] - p_keys) < HIT_SPAN
+        if not hit.any(): return
+        self.p_alive.ravel()[peas[hit]] = False
+        target = hit_slot[j[hit]]
+        np.subtract.at(self.z_hp.ravel(), target, Projectile.DAMAGE)
+        cold = target[self.p_frozen.ravel()[peas[hit]]]
+        self.z_slow.ravel()[cold] = Zombie.SLOW_TIME
+        self.z_speed.ravel()[cold] = self.z_base.ravel()[cold] * Zombie.SLOW_FACTOR
+        self._reap_zombies(live, game)
+
+    def _reap_zombies(self, live, game):
+        dead = self.z_hp.ravel()[live] <= 0
+        if not dead.any(): return
+        self.killed += np.bincount(game[dead], minlength=self.n)
+        self.z_alive.ravel()[live[dead]] = False
+
+    def _run_zombies(self, dt):
+        live, _, lane = self._live_zombies()
+        if not len(live): return
+        z_slow = self.z_slow.ravel()
+        slowed = live[z_slow[live] > 0]
+        if len(slowed):
+            z_slow[slowed] -= dt
+            recovered = slowed[z_slow[slowed] <= 0]
+            self.z_speed.ravel()[recovered] = self.z_base.ravel()[recovered]
+
+        # Same bite test as bite_col(), on every zombie at once
+        x = self.z_x.ravel()[live]
+        k = np.floor(x - 30) - LAWN_LEFT + 9
+        col = k // TILE_W
+        on_lawn = (col >= 0) & (col < COLS) & (k - col * TILE_W < BITE_SPAN)
+        tile = lane * COLS + np.clip(col, 0, COLS - 1).astype(np.int64)
+        eating = on_lawn & (self.plant.ravel()[tile] > 0)
+        walking = live[~eating]
+        self.z_x.ravel()[walking] -= self.z_speed.ravel()[walking] * dt
+
+        bitten = tile[eating]
+        if not len(bitten): return
+        plant_hp = self.plant_hp.ravel()
+        np.subtract.at(plant_hp, bitten, Zombie.DAMAGE * dt)
+        self.plant.ravel()[bitten[plant_hp[bitten] <= 0]] = 0
+
+    def _run_mowers(self, dt):
+        live, game, lane = self._live_zombies()
+        state, mower_x = self.mower_state.ravel(), self.mower_x.ravel()
+        crossed = lane[self.z_x.ravel()[live] < LAWN_LEFT - 15]
+        state[crossed[state[crossed] == 0]] = 1
+        mowing = np.flatnonzero(state == 1)
+        if not len(mowing): return
+        mower_x[mowing] += LawnMower.SPEED * dt
+        hit = (state[lane] == 1) & (np.abs(self.z_x.ravel()[live] - mower_x[lane]) < self.MOWER_REACH)
+        if hit.any():
+            self.killed += np.bincount(game[hit], minlength=self.n)
+            self.z_alive.ravel()[live[hit]] = False
+        state[mowing[mower_x[mowing] > SCREEN_WIDTH + 80]] = 2
+
+def vector_benchmark(num_games=1024, seconds=10.0, seed=0):
+    """Game-ticks per second for one headless Game versus a VectorGame of num_games lawns,
+    both fed the same opening (a column of sunflowers, then peashooters, one per second;
+    the Game plants for free, the lawns only when they can afford it).
+    Returns rows of (engine, games, ticks, game-ticks per second)."""
+    opening = [(SunflowerPlant, r, 0) for r in range(ROWS)] + [(Peashooter, r, 1) for r in range(ROWS)]
+    ticks = round(seconds / SIM_DT)
+
+    random.seed(seed)
+    game = Game(headless=True)
+    game.start()
+    t0 = time.perf_counter()
+    for i in range(ticks):
+        if i % SIM_HZ == 0 and i // SIM_HZ < len(opening):
+            cls, r, c = opening[i // SIM_HZ]
+            game.place_plant(r, c, cls)
+        if game.state != "playing": game.start()
+        game.step(SIM_DT)
+    single = time.perf_counter() - t0
+
+    env = VectorGame(num_games, seed=seed)
+    none = np.zeros(num_games, dtype=np.int64)
+    t0 = time.perf_counter()
+    for i in range(ticks):
+        if i % SIM_HZ == 0 and i // SIM_HZ < len(opening):
+            env.step(np.full(num_games, VectorGame.action(*opening[i // SIM_HZ])))
+        else:
+            env.step(none)
+    batched = time.perf_counter() - t0
+    return [("Game", 1, ticks, ticks / single), ("VectorGame", num_games, ticks, num_games * ticks / batched)]
+
+# ------------------------------------------------------------------
+# MONTE CARLO RUNNER
+# ------------------------------------------------------------------
+# Build orders for ScriptedPolicy: (plant name, row, col), bought in order as sun allows.
+BUILD_ORDERS = {
+    "economy": ([("Sunflower", r, 0) for r in (2, 1, 3, 0, 4)] + [("Peashooter", r, 1) for r in (2, 1, 3, 0, 4)]
+                + [("Sunflower", r, 2) for r in range(ROWS)] + [("Peashooter", r, 3) for r in range(ROWS)]
+                + [("Snow Pea", r, 4) for r in range(ROWS)] + [("Wall-nut", r, 7) for r in range(ROWS)]),
+    "defense": ([("Peashooter", r, 1) for r in (2, 1, 3, 0, 4)] + [("Sunflower", r, 0) for r in (2, 1, 3, 0, 4)]
+                + [("Wall-nut", r, 6) for r in range(ROWS)] + [("Peashooter", r, 2) for r in range(ROWS)]
+                + [("Snow Pea", r, 3) for r in range(ROWS)]),
+}
+
+class ScriptedPolicy:
+    """
+    Plays a headless Game like an attentive player: every `think` seconds it picks up the
+    suns that have settled and buys the first empty tile of its build order once that card
+    is ready and affordable. Tiles whose plant was eaten come up again, so the order also
+    repairs the lawn.
+    """
+    def __init__(self, order, think=0.25):
+        self.order = [(PLANT_DATA[name]["cls"], row, col) for name, row, col in order]
+        self.think = think
+
+    def act(self, game):
+        for s in [s for s in game.suns if s.floating and s.life > 0]:
+            game.collect_sun(s)
+        cards = {card.plant_cls: card for card in game.cards}
+        for cls, row, col in self.order:
+            if game.plant_at(row, col) is not None: continue
+            if cards[cls].available(game.sun): game.buy_plant(row, col, cards[cls])
+            return
+
+    def play(self, game, seconds):
+        while game.state == "playing" and game.elapsed < seconds:
+            self.act(game)
+            game.simulate(self.think)
+
+def run_episode(seed, policy="economy", mode="adventure", seconds=LEVEL_DURATION + 10.0):
+    """One seeded headless game under a ScriptedPolicy. Returns its outcome record; a Python
+    error inside the game is recorded as outcome "error" instead of raised."""
+    record = {"seed": seed, "policy": policy, "mode": mode}
+    t0 = time.perf_counter()
+    try:
+        random.seed(seed)
+        game = Game(headless=True, audio=False)
+        game.start(mode)
+        ScriptedPolicy(BUILD_ORDERS[policy]).play(game, seconds)
+    except Exception as e:
+        record.update(outcome="error", error=repr(e))
+        return record
+    record.update(
+        outcome={"win": "win", "game_over": "loss"}.get(game.state, "timeout"),
+        survived=round(game.elapsed, 3),
+        sun_collected=game.sun_collected,
+        sun_spent=game.sun_spent,
+        sun_left=game.sun,
+        zombies_spawned=game.zombies_spawned,
+        zombies_killed=game.zombies_killed,
+        plants=len(game.plants),
+        wall=round(time.perf_counter() - t0, 4),
+    )
+    return record
+
+def _pool_runs(jobs, workers, lost):
+    """Run the jobs deque on a fresh process pool, yielding records as they finish. Keeps
+    2 jobs per worker in flight; if a worker dies the pool is abandoned and the jobs that
+    were in flight go to `lost` (the rest stay in `jobs`)."""
+    with ProcessPoolExecutor(workers) as pool:
+        running = {}
+        while jobs or running:
+            while jobs and len(running) < 2 * workers:
+                job = jobs.popleft()
+                running[pool.submit(run_episode, **job)] = job
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for f in done:
+                job = running.pop(f)
+                try:
+                    record = f.result()
+                except BrokenProcessPool:
+                    lost.append(job)
+                    continue
+                yield record
+            if lost:
+                lost.extend(running.values())
+                return
+
+def monte_carlo(runs, first_seed=0, policy="economy", mode="adventure", workers=None, out=None):
+    """
+    Play seeds first_seed .. first_seed + runs - 1 across a process pool and yield each
+    outcome record as it finishes. With `out`, records are appended to that JSON-lines file
+    as they arrive and seeds already recorded there for this policy and mode are skipped,
+    so an interrupted sweep resumes where it stopped.
+
+    A crashed worker takes its in-flight games down with it: those are replayed one at a
+    time in a single-worker pool, and a game that crashes on its own is recorded with
+    outcome "crash" (seeded games are deterministic, so retrying it again is pointless).
+    """
+    workers = workers or os.cpu_count() or 1
+    done = set()
+    if out is not None and os.path.exists(out):
+        done = {r["seed"] for r in load_results(out) if r["policy"] == policy and r["mode"] == mode}
+    jobs = deque({"seed": s, "policy": policy, "mode": mode}
+                 for s in range(first_seed, first_seed + runs) if s not in done)
+    sink = open(out, "a") if out is not None else None
+    try:
+        def emit(record):
+            if sink is not None:
+                sink.write(json.dumps(record) + "\n")
+                sink.flush()
+            return record
+
+        while jobs:
+            lost = []
+            for record in _pool_runs(jobs, workers, lost): yield emit(record)
+            for job in lost:
+                alone = []
+                for record in _pool_runs(deque([job]), 1, alone): yield emit(record)
+                if alone: yield emit(dict(job, outcome="crash"))
+    finally:
+        if sink is not None: sink.close()
+
+def load_results(path):
+    """Records of a monte_carlo results file; a line cut short by a kill is ignored."""
+    records = []
+    with open(path) as f:
+        for line in f:
+            try: records.append(json.loads(line))
+            except ValueError: pass
+    return records
+
+def summarize(records):
+    """Aggregate outcome records per (policy, mode). Returns rows of dicts with run counts,
+    win/loss rates and means over the games that finished."""
+    groups = {}
+    for r in records: groups.setdefault((r["policy"], r["mode"]), []).append(r)
+    rows = []
+    for (policy, mode), group in sorted(groups.items()):
+        played = [r for r in group if r["outcome"] in ("win", "loss", "timeout")]
+        mean = lambda key: statistics.fmean(r[key] for r in played) if played else 0.0
+        rows.append({
+            "policy": policy, "mode": mode, "runs": len(group),
+            "win": sum(r["outcome"] == "win" for r in played) / max(len(played), 1),
+            "loss": sum(r["outcome"] == "loss" for r in played) / max(len(played), 1),
+            "failed": len(group) - len(played),
+            "survived": mean("survived"),
+            "survived_median": statistics.median(r["survived"] for r in played) if played else 0.0,
+            "killed": mean("zombies_killed"),
+            "sun_collected": mean("sun_collected"),
+            "sun_spent": mean("sun_spent"),
+        })
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AC'S PVZ Engine")
+    parser.add_argument("--headless", action="store_true", help="run the simulation only: no window, fonts or audio")
+    parser.add_argument("--mode", default="adventure", choices=("adventure", "zen_garden"))
+    parser.add_argument("--seconds", type=float, default=LEVEL_DURATION, help="game time to simulate in headless mode")
+    parser.add_argument("--dt", type=float, default=SIM_DT, help="simulation step in headless mode")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--zombie-store", action="store_true", help="keep zombies in batched NumPy arrays (horde runs)")
+    parser.add_argument("--profile", action="store_true", help="time each simulation system in headless mode")
+    parser.add_argument("--predict-hits", action="store_true", help="schedule pea hits from their time of impact")
+    parser.add_argument("--dirty-rects", action="store_true", help="push only changed screen regions instead of flipping")
+    parser.add_argument("--no-audio", action="store_true", help="no mixer, no synthesis (same as PVZ_NO_AUDIO=1)")
+    parser.add_argument("--no-asset-cache", action="store_true", help="don't read or write the on-disk asset cache")
+    parser.add_argument("--bench", choices=("audio", "memory", "rects", "vector"), help="run a micro-benchmark and exit")
+    parser.add_argument("--monte-carlo", type=int, metavar="RUNS", help="play RUNS seeded headless games (from --seed) on a process pool")
+    parser.add_argument("--policy", default="economy", choices=tuple(BUILD_ORDERS), help="build order for --monte-carlo")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes for --monte-carlo (default: all cores)")
+    parser.add_argument("--out", default=None, help="JSON-lines results file for --monte-carlo; appended to and resumed from")
+    parser.add_argument("--count", type=int, default=None, help="entities per type for --bench memory, lawns for --bench vector")
+    args = parser.parse_args(argv)
+
+    if args.seed is not None: random.seed(args.seed)
+
+    if args.bench == "audio":
+        print(f"{'effect':<12} {'loop ms':>9} {'vector ms':>10} {'speedup':>8}")
+        for name, before, after in SoundManager.benchmark():
+            print(f"{name:<12} {before:9.3f} {after:10.3f} {before / max(after, 1e-9):7.1f}x")
+        return
+    if args.bench == "memory":
+        print(f"{'entity':<16} {'bytes/instance':>14}")
+        for name, size in memory_benchmark(args.count or 10000):
+            print(f"{name:<16} {size:14.1f}")
+        return
+    if args.bench == "rects":
+        print(f"{'mode':<10} {'frames':>6} {'update':>7} {'created':>8} {'sim/frame':>10} {'draw':>8} {'draw/frame':>11}")
+        for name, frames, update, created, draw in rect_benchmark():
+            print(f"{name:<10} {frames:6d} {update:7d} {created:8d} {(update - created) / frames:10.3f} "
+                  f"{draw:8d} {draw / frames:11.1f}")
+        return
+    if args.bench == "vector":
+        print(f"{'engine':<11} {'games':>6} {'ticks':>6} {'game-ticks/s':>13}")
+        for name, games, ticks, rate in vector_benchmark(args.count or 1024, seed=args.seed or 0):
+            print(f"{name:<11} {games:6d} {ticks:6d} {rate:13.0f}")
+        return
+
+    if args.monte_carlo:
+        first, every, t0 = args.seed or 0, max(1, args.monte_carlo // 20), time.perf_counter()
+        records = []
+        for i, r in enumerate(monte_carlo(args.monte_carlo, first, args.policy, args.mode, args.workers, args.out), 1):
+            records.append(r)
+            if i % every == 0:
+                print(f"{i} runs  {i / (time.perf_counter() - t0):.1f} runs/s  last: seed={r['seed']} {r['outcome']}", flush=True)
+        if args.out is not None: records = load_results(args.out)
+        print(f"{'policy':<9} {'mode':<11} {'runs':>6} {'win':>6} {'loss':>6} {'failed':>6} "
+              f"{'survived':>9} {'median':>7} {'killed':>7} {'sun in':>7} {'sun out':>8}")
+        for row in summarize(records):
+            print(f"{row['policy']:<9} {row['mode']:<11} {row['runs']:6d} {row['win']:6.1%} {row['loss']:6.1%} {row['failed']:6d} "
+                  f"{row['survived']:9.1f} {row['survived_median']:7.1f} {row['killed']:7.1f} "
+                  f"{row['sun_collected']:7.0f} {row['sun_spent']:8.0f}")
+        return
+
+    if args.headless:
+        game = Game(headless=True, zombie_store=args.zombie_store, predict_hits=args.predict_hits,
+                    profile_systems=args.profile)
+        game.start(args.mode)
+        t0 = time.perf_counter()
+        state = game.simulate(args.seconds, args.dt)
+        wall = time.perf_counter() - t0
+        print(f"state={state} simulated={game.elapsed:.1f}s wall={wall:.3f}s "
+              f"speedup={game.elapsed / max(wall, 1e-9):.0f}x zombies={len(game.zombies)} numpy={'loaded' if np.loaded else 'unused'}")
+        for name, st in game.pool_stats().items():
+            print(f"{name} pool: live={st['live']} free={st['free']} high_water={st['high_water']} created={st['created']}")
+        if args.profile:
+            for name, ms in game.profile_report():
+                print(f"  {name:<16} {ms * 1000:8.2f} us/tick")
+        return
+
+    Game(zombie_store=args.zombie_store, predict_hits=args.predict_hits, dirty_rects=args.dirty_rects, asset_cache=not args.no_asset_cache,
+         audio=not args.no_audio).run()
+
 if __name__ == "__main__":
-    Game().run()
+    main()